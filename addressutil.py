@@ -17,35 +17,138 @@ True
 The function `addressutil.Address.parse()` takes two arguments: the delivery address itself and the last line of the address (where the city, state, and ZIP
 code are usually written). The outputted string separates the delivery address and the last line with a newline, just like how it would be written on an
 envelope.
+
+### Highway names
+When a street name begins with a highway name from `HIGHWAY_MAPPING` followed by a highway number, `addressutil.Address.parse()` writes the highway
+name out in its standard form. For example, "CR 7" becomes "COUNTY ROAD 7" and "INTERSTATE HWY 75" becomes "INTERSTATE 75". Older releases left
+these street names as written, so addresses parsed (and then pickled or stored) by an older release are no longer equal to, and do not hash the same
+as, the same addresses parsed now.
 """
 
 from __future__ import annotations
 import enum
+import functools
 import re
-from typing import Optional
+import sys
+import types
+from typing import Iterable, Mapping, NamedTuple, Optional, Union
 
-DIRECTIONS_LIST: tuple[str, ...] = ("N", "E", "S", "W", "NW", "NE", "SE", "SW", "NORTH", "EAST", "SOUTH", "WEST", "NORTHWEST", "NORTHEAST", "SOUTHEAST", "SOUTHWEST")
+DIRECTIONS_LIST: frozenset[str] = frozenset(("N", "E", "S", "W", "NW", "NE", "SE", "SW", "NORTH", "EAST", "SOUTH", "WEST", "NORTHWEST", "NORTHEAST", "SOUTHEAST", "SOUTHWEST"))
 """The 8 directions accepted by USPS, together with their spelled-out variants"""
 
-DIRECTIONS_MAPPING: dict[str, str] = {"NORTH": "N", "EAST": "E", "SOUTH": "S", "WEST": "W", "NORTHWEST": "NW", "NORTHEAST": "NE", "SOUTHEAST": "SE", "SOUTHWEST": "SW"}
+DIRECTIONS_MAPPING: Mapping[str, str] = {"NORTH": "N", "EAST": "E", "SOUTH": "S", "WEST": "W", "NORTHWEST": "NW", "NORTHEAST": "NE", "SOUTHEAST": "SE", "SOUTHWEST": "SW"}
 """Dictionary to convert spelled-out directions to USPS-preferred directions"""
 
-HIGHWAY_MAPPING: dict[str, str] = {"COUNTY HIGHWAY": "COUNTY HIGHWAY", "COUNTY HWY": "COUNTY HIGHWAY", "CNTY HWY": "COUNTY HIGHWAY", "COUNTY HWY": "COUNTY HIGHWAY", "COUNTY ROAD": "COUNTY ROAD", "COUNTY RD": "COUNTY ROAD", "CR": "COUNTY ROAD", "CNTY ROAD": "COUNTY ROAD", "CNTY RD": "COUNTY ROAD", "EXPRESSWAY": "EXPRESSWAY", "EXP": "EXPRESSWAY", "EXPR": "EXPRESSWAY", "EXPRESS": "EXPRESSWAY", "EXPW": "EXPRESSWAY", "EXPY": "EXPRESSWAY", "FARM TO MARKET": "FM", "FM": "FM", "HWY FM": "FM", "HWY": "HIGHWAY", "HIWAY": "HIGHWAY", "IH": "INTERSTATE", "INTERSTATE": "INTERSTATE", "INTERSTATE HWY": "INTERSTATE", "INTERSTATE HIGHWAY": "INTERSTATE", "LOOP": "LOOP", "RD": "ROAD", "RT": "ROUTE", "RTE": "ROUTE", "RANCH RD": "RANCH ROAD", "ST HIGHWAY": "STATE HIGHWAY", "STATE HWY": "STATE HIGHWAY", "STATE HIGHWAY": "STATE HIGHWAY", "ST HWY": "STATE HIGHWAY", "SH": "STATE HIGHWAY", "SR": "STATE ROAD", "ST RD": "STATE ROAD", "ST ROAD": "STATE ROAD", "STATE ROAD": "STATE ROAD", "ST RT": "STATE ROUTE", "STATE RT": "STATE ROUTE", "ST ROUTE": "STATE ROUTE", "ST RTE": " STATE ROUTE", "STATE RTE": "STATE ROUTE", "TOWNSHIP RD": "TOWNSHIP ROAD", "TSR": "TOWNSHIP ROAD", "US": "US HIGHWAY", "US HWY": "US HIGHWAY", "US HIGHWAY": "US HIGHWAY"}
+HIGHWAY_MAPPING: Mapping[str, str] = {"COUNTY HIGHWAY": "COUNTY HIGHWAY", "COUNTY HWY": "COUNTY HIGHWAY", "CNTY HWY": "COUNTY HIGHWAY", "COUNTY ROAD": "COUNTY ROAD", "COUNTY RD": "COUNTY ROAD", "CR": "COUNTY ROAD", "CNTY ROAD": "COUNTY ROAD", "CNTY RD": "COUNTY ROAD", "EXPRESSWAY": "EXPRESSWAY", "EXP": "EXPRESSWAY", "EXPR": "EXPRESSWAY", "EXPRESS": "EXPRESSWAY", "EXPW": "EXPRESSWAY", "EXPY": "EXPRESSWAY", "FARM TO MARKET": "FM", "FM": "FM", "HWY FM": "FM", "HWY": "HIGHWAY", "HIWAY": "HIGHWAY", "IH": "INTERSTATE", "INTERSTATE": "INTERSTATE", "INTERSTATE HWY": "INTERSTATE", "INTERSTATE HIGHWAY": "INTERSTATE", "LOOP": "LOOP", "RD": "ROAD", "RT": "ROUTE", "RTE": "ROUTE", "RANCH RD": "RANCH ROAD", "ST HIGHWAY": "STATE HIGHWAY", "STATE HWY": "STATE HIGHWAY", "STATE HIGHWAY": "STATE HIGHWAY", "ST HWY": "STATE HIGHWAY", "SH": "STATE HIGHWAY", "SR": "STATE ROAD", "ST RD": "STATE ROAD", "ST ROAD": "STATE ROAD", "STATE ROAD": "STATE ROAD", "ST RT": "STATE ROUTE", "STATE RT": "STATE ROUTE", "ST ROUTE": "STATE ROUTE", "ST RTE": "STATE ROUTE", "STATE RTE": "STATE ROUTE", "TOWNSHIP RD": "TOWNSHIP ROAD", "TSR": "TOWNSHIP ROAD", "US": "US HIGHWAY", "US HWY": "US HIGHWAY", "US HIGHWAY": "US HIGHWAY"}
 """Dictionary to standardize highway names"""
 
-SECONDARY_UNIT_INDICATORS: tuple[str, ...] = ("APARTMENT", "APT", "BASEMENT", "BSMT", "BUILDING", "BLDG", "DEPARTMENT", "DEPT", "FLOOR", "FL", "FRONT", "FRNT", "HANGER", "HANGAR", "HNGR", "KEY", "LOBBY", "LBBY", "LOT", "LOWER", "LOWR", "OFFICE", "OFC", "PENTHOUSE", "PH", "PIER", "REAR", "ROOM", "RM", "SIDE", "SPACE", "SPC", "STOP", "SUITE", "STE", "TRAILER", "TRLR", "UNIT", "UPPER", "UPPR")
+SECONDARY_UNIT_INDICATORS: frozenset[str] = frozenset(("APARTMENT", "APT", "BASEMENT", "BSMT", "BUILDING", "BLDG", "DEPARTMENT", "DEPT", "FLOOR", "FL", "FRONT", "FRNT", "HANGER", "HANGAR", "HNGR", "KEY", "LOBBY", "LBBY", "LOT", "LOWER", "LOWR", "OFFICE", "OFC", "PENTHOUSE", "PH", "PIER", "REAR", "ROOM", "RM", "SIDE", "SPACE", "SPC", "STOP", "SUITE", "STE", "TRAILER", "TRLR", "UNIT", "UPPER", "UPPR"))
 """USPS Indicators for a secondary unit (address line 2)"""
 # List formerly contained "SLIP", but this caused breakage.
 
-STATE_NAME_MAPPING: dict[str, str] = {"ALABAMA": "AL", "ALASKA": "AK", "AMERICAN SAMOA": "AS", "ARIZONA": "AZ", "ARKANSAS": "AR", "BAKER ISLAND": "BI", "CALIFORNIA": "CA", "COLORADO": "CO", "CONNECTICUT": "CT", "DELAWARE": "DE", "DISTRICT OF COLUMBIA": "DC", "FLORIDA": "FL", "FEDERATED STATES OF MICRONESIA": "FM", "GEORGIA": "GA", "GUAM": "GU", "HAWAII": "HI", "HOWLAND ISLAND": "HI", "IDAHO": "ID", "ILLINOIS": "IL", "INDIANA": "IN", "IOWA": "IA", "JARVIS ISLAND": "JI", "JOHNSTON ATOLL": "JA", "KANSAS": "KS", "KENTUCKY": "KY", "KINGMAN REEF": "KR", "LOUISIANA": "LA", "MAINE": "ME", "MARSHALL ISLANDS": "MH", "MARYLAND": "MD", "MASSACHUSETTS": "MA", "MICHIGAN": "MI", "MIDWAY ISLANDS": "MI", "MINNESOTA": "MN", "MISSISSIPPI": "MS", "MISSOURI": "MO", "MONTANA": "MT", "NAVASSA ISLAND": "NI", "NEBRASKA": "NE", "NEVADA": "NV", "NEW HAMPSHIRE": "NH", "NEW JERSEY": "NJ", "NEW MEXICO": "NM", "NEW YORK": "NY", "NORTH CAROLINA": "NC", "NORTH DAKOTA": "ND", "NORTHERN MARIANA ISLANDS": "MP", "OHIO": "OH", "OKLAHOMA": "OK", "OREGON": "OR", "PALAU": "PW", "PALMYRA ATOLL": "PA", "PENNSYLVANIA": "PA", "PUERTO RICO": "PR", "RHODE ISLAND": "RI", "SOUTH CAROLINA": "SC", "SOUTH DAKOTA": "SD", "TENNESSEE": "TN", "TEXAS": "TX", "U.S. MINOR OUTLYING ISLANDS": "UM", "UTAH": "UT", "VERMONT": "VT", "VIRGINIA": "VA", "VIRGIN ISLANDS OF THE U.S.": "VI", "WAKE ISLAND": "WI", "WASHINGTON": "WA", "WEST VIRGINIA": "WV", "WISCONSIN": "WI", "WYOMING": "WY",}
+STATE_NAME_MAPPING: Mapping[str, str] = {"ALABAMA": "AL", "ALASKA": "AK", "AMERICAN SAMOA": "AS", "ARIZONA": "AZ", "ARKANSAS": "AR", "BAKER ISLAND": "BI", "CALIFORNIA": "CA", "COLORADO": "CO", "CONNECTICUT": "CT", "DELAWARE": "DE", "DISTRICT OF COLUMBIA": "DC", "FLORIDA": "FL", "FEDERATED STATES OF MICRONESIA": "FM", "GEORGIA": "GA", "GUAM": "GU", "HAWAII": "HI", "HOWLAND ISLAND": "HI", "IDAHO": "ID", "ILLINOIS": "IL", "INDIANA": "IN", "IOWA": "IA", "JARVIS ISLAND": "JI", "JOHNSTON ATOLL": "JA", "KANSAS": "KS", "KENTUCKY": "KY", "KINGMAN REEF": "KR", "LOUISIANA": "LA", "MAINE": "ME", "MARSHALL ISLANDS": "MH", "MARYLAND": "MD", "MASSACHUSETTS": "MA", "MICHIGAN": "MI", "MIDWAY ISLANDS": "MI", "MINNESOTA": "MN", "MISSISSIPPI": "MS", "MISSOURI": "MO", "MONTANA": "MT", "NAVASSA ISLAND": "NI", "NEBRASKA": "NE", "NEVADA": "NV", "NEW HAMPSHIRE": "NH", "NEW JERSEY": "NJ", "NEW MEXICO": "NM", "NEW YORK": "NY", "NORTH CAROLINA": "NC", "NORTH DAKOTA": "ND", "NORTHERN MARIANA ISLANDS": "MP", "OHIO": "OH", "OKLAHOMA": "OK", "OREGON": "OR", "PALAU": "PW", "PALMYRA ATOLL": "PA", "PENNSYLVANIA": "PA", "PUERTO RICO": "PR", "RHODE ISLAND": "RI", "SOUTH CAROLINA": "SC", "SOUTH DAKOTA": "SD", "TENNESSEE": "TN", "TEXAS": "TX", "U.S. MINOR OUTLYING ISLANDS": "UM", "UTAH": "UT", "VERMONT": "VT", "VIRGINIA": "VA", "VIRGIN ISLANDS OF THE U.S.": "VI", "WAKE ISLAND": "WI", "WASHINGTON": "WA", "WEST VIRGINIA": "WV", "WISCONSIN": "WI", "WYOMING": "WY",}
 """Mapping of state names to abbreviations"""
 
-STREET_SUFFIXES: tuple[str, ...] = ("ALLEE", "ALLEY", "ALLY", "ALY", "ANEX", "ANNEX", "ANNX", "ANX", "ARC ", "ARCADE ", "AV", "AVE", "AVEN", "AVENU", "AVENUE", "AVN", "AVNUE", "BAYOO", "BAYOU", "BCH", "BEACH", "BEND", "BND", "BLF", "BLUF", "BLUFF", "BLUFFS ", "BOT", "BTM", "BOTTM", "BOTTOM", "BLVD", "BOUL", "BOULEVARD ", "BOULV", "BR", "BRNCH", "BRANCH", "BRDGE", "BRG", "BRIDGE", "BRK", "BROOK", "BROOKS ", "BURG", "BURGS", "BYP", "BYPA", "BYPAS", "BYPASS", "BYPS", "CAMP", "CP", "CMP", "CANYN", "CANYON", "CNYN", "CAPE", "CPE", "CAUSEWAY", "CAUSWA", "CSWY", "CEN", "CENT", "CENTER", "CENTR", "CENTRE", "CNTER", "CNTR", "CTR", "CENTERS ", "CIR", "CIRC", "CIRCL", "CIRCLE", "CRCL", "CRCLE", "CIRCLES", "CLF", "CLIFF", "CLFS", "CLIFFS", "CLB", "CLUB", "COMMON", "COMMONS", "COR", "CORNER", "CORNERS", "CORS", "COURSE", "CRSE", "COURT", "CT", "COURTS", "CTS", "COVE", "CV", "COVES", "CREEK", "CRK", "CRESCENT", "CRES", "CRSENT", "CRSNT", "CREST", "CROSSING ", "CRSSNG ", "XING ", "CROSSROAD", "CROSSROADS", "CURVE ", "DALE ", "DL ", "DAM ", "DM ", "DIV", "DIVIDE", "DV", "DVD", "DR", "DRIV", "DRIVE", "DRV", "DRIVES", "EST", "ESTATE", "ESTATES", "ESTS", "EXP", "EXPR", "EXPRESS", "EXPRESSWAY", "EXPW", "EXPY", "EXT", "EXTENSION", "EXTN", "EXTNSN", "EXTS", "FALL", "FALLS", "FLS", "FERRY", "FRRY", "FRY", "FIELD", "FLD", "FIELDS", "FLDS", "FLAT", "FLT", "FLATS", "FLTS", "FORD", "FRD", "FORDS", "FOREST", "FORESTS", "FRST", "FORG", "FORGE", "FRG", "FORGES", "FORK", "FRK", "FORKS", "FRKS", "FORT", "FRT", "FT", "FREEWAY", "FREEWY", "FRWAY", "FRWY", "FWY", "GARDEN", "GARDN", "GRDEN", "GRDN", "GARDENS", "GDNS", "GRDNS", "GATEWAY", "GATEWY", "GATWAY", "GTWAY", "GTWY", "GLEN", "GLN", "GLENS", "GREEN", "GRN", "GREENS", "GROV", "GROVE", "GRV", "GROVES", "HARB", "HARBOR", "HARBR", "HBR", "HRBOR", "HARBORS", "HAVEN", "HVN", "HT", "HTS", "HIGHWAY", "HIGHWY", "HIWAY", "HIWY", "HWAY", "HWY", "HILL", "HL", "HILLS", "HLS", "HLLW", "HOLLOW", "HOLLOWS", "HOLW", "HOLWS", "INLT", "IS", "ISLAND", "ISLND", "ISLANDS", "ISLNDS", "ISS", "ISLE", "ISLES", "JCT", "JCTION", "JCTN", "JUNCTION", "JUNCTN", "JUNCTON", "JCTNS", "JCTS", "JUNCTIONS", "KEY", "KY", "KEYS", "KYS", "KNL", "KNOL", "KNOLL", "KNLS", "KNOLLS", "LK", "LAKE", "LKS", "LAKES", "LAND", "LANDING", "LNDG", "LNDNG", "LANE", "LN", "LGT", "LIGHT", "LIGHTS", "LF", "LOAF", "LCK", "LOCK", "LCKS", "LOCKS", "LDG", "LDGE", "LODG", "LODGE", "LOOP", "LOOPS", "MALL", "MNR", "MANOR", "MANORS", "MNRS", "MEADOW", "MDW", "MDWS", "MEADOWS", "MEDOWS", "MEWS", "MILL", "MILLS", "MISSN", "MSSN", "MOTORWAY", "MNT", "MT", "MOUNT", "MNTAIN", "MNTN", "MOUNTAIN", "MOUNTIN", "MTIN", "MTN", "MNTNS", "MOUNTAINS", "NCK", "NECK", "ORCH", "ORCHARD", "ORCHRD", "OVAL", "OVL", "OVERPASS", "PARK", "PRK", "PARKS", "PARKWAY", "PARKWY", "PKWAY", "PKWY", "PKY", "PARKWAYS", "PKWYS", "PASS", "PASSAGE", "PATH", "PATHS", "PIKE", "PIKES", "PINE", "PINES", "PNES", "PL", "PLAIN", "PLN", "PLAINS", "PLNS", "PLAZA", "PLZ", "PLZA", "POINT", "PT", "POINTS", "PTS", "PORT", "PRT", "PORTS", "PRTS", "PR", "PRAIRIE", "PRR", "RAD", "RADIAL", "RADIEL", "RADL", "RAMP", "RANCH", "RANCHES", "RNCH", "RNCHS", "RAPID", "RPD", "RAPIDS", "RPDS", "REST", "RST", "RDG", "RDGE", "RIDGE", "RDGS", "RIDGES", "RIV", "RIVER", "RVR", "RIVR", "RD", "ROAD", "ROADS", "RDS", "ROUTE", "ROW", "RUE", "RUN", "SHL", "SHOAL", "SHLS", "SHOALS", "SHOAR", "SHORE", "SHR", "SHOARS", "SHORES", "SHRS", "SKYWAY", "SPG", "SPNG", "SPRING", "SPRNG", "SPGS", "SPNGS", "SPRINGS", "SPRNGS", "SPUR", "SPURS", "SQ", "SQR", "SQRE", "SQU", "SQUARE", "SQRS", "SQUARES", "STA", "STATION", "STATN", "STN", "STRA", "STRAV", "STRAVEN", "STRAVENUE", "STRAVN", "STRVN", "STRVNUE", "STREAM", "STREME", "STRM", "STREET", "STRT", "ST", "STR", "STREETS", "SMT", "SUMIT", "SUMITT", "SUMMIT", "TER", "TERR", "TERRACE", "THROUGHWAY", "TRACE", "TRACES", "TRCE", "TRACK", "TRACKS", "TRAK", "TRK", "TRKS", "TRAFFICWAY", "TRAIL", "TRAILS", "TRL", "TRLS", "TRAILER", "TRLR", "TRLRS", "TUNEL", "TUNL", "TUNLS", "TUNNEL", "TUNNELS", "TUNNL", "TRNPK", "TURNPIKE", "TURNPK", "UNDERPASS", "UN", "UNION", "UNIONS", "VALLEY", "VALLY", "VLLY", "VLY", "VALLEYS", "VLYS", "VDCT", "VIA", "VIADCT", "VIADUCT", "VIEW", "VW", "VIEWS", "VWS", "VILL", "VILLAG", "VILLAGE", "VILLG", "VILLIAGE", "VLG", "VILLAGES", "VLGS", "VILLE", "VL", "VIS", "VIST", "VISTA", "VST", "VSTA", "WALK", "WALKS", "WALL", "WY", "WAY", "WAYS", "WELL", "WELLS")
-"""Tuple of street suffixes accepted by USPS"""
+STREET_SUFFIXES: frozenset[str] = frozenset(("ALLEE", "ALLEY", "ALLY", "ALY", "ANEX", "ANNEX", "ANNX", "ANX", "ARC", "ARCADE", "AV", "AVE", "AVEN", "AVENU", "AVENUE", "AVN", "AVNUE", "BAYOO", "BAYOU", "BCH", "BEACH", "BEND", "BND", "BLF", "BLUF", "BLUFF", "BLUFFS", "BOT", "BTM", "BOTTM", "BOTTOM", "BLVD", "BOUL", "BOULEVARD", "BOULV", "BR", "BRNCH", "BRANCH", "BRDGE", "BRG", "BRIDGE", "BRK", "BROOK", "BROOKS", "BURG", "BURGS", "BYP", "BYPA", "BYPAS", "BYPASS", "BYPS", "CAMP", "CP", "CMP", "CANYN", "CANYON", "CNYN", "CAPE", "CPE", "CAUSEWAY", "CAUSWA", "CSWY", "CEN", "CENT", "CENTER", "CENTR", "CENTRE", "CNTER", "CNTR", "CTR", "CENTERS", "CIR", "CIRC", "CIRCL", "CIRCLE", "CRCL", "CRCLE", "CIRCLES", "CLF", "CLIFF", "CLFS", "CLIFFS", "CLB", "CLUB", "COMMON", "COMMONS", "COR", "CORNER", "CORNERS", "CORS", "COURSE", "CRSE", "COURT", "CT", "COURTS", "CTS", "COVE", "CV", "COVES", "CREEK", "CRK", "CRESCENT", "CRES", "CRSENT", "CRSNT", "CREST", "CROSSING", "CRSSNG", "XING", "CROSSROAD", "CROSSROADS", "CURVE", "DALE", "DL", "DAM", "DM", "DIV", "DIVIDE", "DV", "DVD", "DR", "DRIV", "DRIVE", "DRV", "DRIVES", "EST", "ESTATE", "ESTATES", "ESTS", "EXP", "EXPR", "EXPRESS", "EXPRESSWAY", "EXPW", "EXPY", "EXT", "EXTENSION", "EXTN", "EXTNSN", "EXTS", "FALL", "FALLS", "FLS", "FERRY", "FRRY", "FRY", "FIELD", "FLD", "FIELDS", "FLDS", "FLAT", "FLT", "FLATS", "FLTS", "FORD", "FRD", "FORDS", "FOREST", "FORESTS", "FRST", "FORG", "FORGE", "FRG", "FORGES", "FORK", "FRK", "FORKS", "FRKS", "FORT", "FRT", "FT", "FREEWAY", "FREEWY", "FRWAY", "FRWY", "FWY", "GARDEN", "GARDN", "GRDEN", "GRDN", "GARDENS", "GDNS", "GRDNS", "GATEWAY", "GATEWY", "GATWAY", "GTWAY", "GTWY", "GLEN", "GLN", "GLENS", "GREEN", "GRN", "GREENS", "GROV", "GROVE", "GRV", "GROVES", "HARB", "HARBOR", "HARBR", "HBR", "HRBOR", "HARBORS", "HAVEN", "HVN", "HT", "HTS", "HIGHWAY", "HIGHWY", "HIWAY", "HIWY", "HWAY", "HWY", "HILL", "HL", "HILLS", "HLS", "HLLW", "HOLLOW", "HOLLOWS", "HOLW", "HOLWS", "INLT", "IS", "ISLAND", "ISLND", "ISLANDS", "ISLNDS", "ISS", "ISLE", "ISLES", "JCT", "JCTION", "JCTN", "JUNCTION", "JUNCTN", "JUNCTON", "JCTNS", "JCTS", "JUNCTIONS", "KEY", "KY", "KEYS", "KYS", "KNL", "KNOL", "KNOLL", "KNLS", "KNOLLS", "LK", "LAKE", "LKS", "LAKES", "LAND", "LANDING", "LNDG", "LNDNG", "LANE", "LN", "LGT", "LIGHT", "LIGHTS", "LF", "LOAF", "LCK", "LOCK", "LCKS", "LOCKS", "LDG", "LDGE", "LODG", "LODGE", "LOOP", "LOOPS", "MALL", "MNR", "MANOR", "MANORS", "MNRS", "MEADOW", "MDW", "MDWS", "MEADOWS", "MEDOWS", "MEWS", "MILL", "MILLS", "MISSN", "MSSN", "MOTORWAY", "MNT", "MT", "MOUNT", "MNTAIN", "MNTN", "MOUNTAIN", "MOUNTIN", "MTIN", "MTN", "MNTNS", "MOUNTAINS", "NCK", "NECK", "ORCH", "ORCHARD", "ORCHRD", "OVAL", "OVL", "OVERPASS", "PARK", "PRK", "PARKS", "PARKWAY", "PARKWY", "PKWAY", "PKWY", "PKY", "PARKWAYS", "PKWYS", "PASS", "PASSAGE", "PATH", "PATHS", "PIKE", "PIKES", "PINE", "PINES", "PNES", "PL", "PLAIN", "PLN", "PLAINS", "PLNS", "PLAZA", "PLZ", "PLZA", "POINT", "PT", "POINTS", "PTS", "PORT", "PRT", "PORTS", "PRTS", "PR", "PRAIRIE", "PRR", "RAD", "RADIAL", "RADIEL", "RADL", "RAMP", "RANCH", "RANCHES", "RNCH", "RNCHS", "RAPID", "RPD", "RAPIDS", "RPDS", "REST", "RST", "RDG", "RDGE", "RIDGE", "RDGS", "RIDGES", "RIV", "RIVER", "RVR", "RIVR", "RD", "ROAD", "ROADS", "RDS", "ROUTE", "ROW", "RUE", "RUN", "SHL", "SHOAL", "SHLS", "SHOALS", "SHOAR", "SHORE", "SHR", "SHOARS", "SHORES", "SHRS", "SKYWAY", "SPG", "SPNG", "SPRING", "SPRNG", "SPGS", "SPNGS", "SPRINGS", "SPRNGS", "SPUR", "SPURS", "SQ", "SQR", "SQRE", "SQU", "SQUARE", "SQRS", "SQUARES", "STA", "STATION", "STATN", "STN", "STRA", "STRAV", "STRAVEN", "STRAVENUE", "STRAVN", "STRVN", "STRVNUE", "STREAM", "STREME", "STRM", "STREET", "STRT", "ST", "STR", "STREETS", "SMT", "SUMIT", "SUMITT", "SUMMIT", "TER", "TERR", "TERRACE", "THROUGHWAY", "TRACE", "TRACES", "TRCE", "TRACK", "TRACKS", "TRAK", "TRK", "TRKS", "TRAFFICWAY", "TRAIL", "TRAILS", "TRL", "TRLS", "TRAILER", "TRLR", "TRLRS", "TUNEL", "TUNL", "TUNLS", "TUNNEL", "TUNNELS", "TUNNL", "TRNPK", "TURNPIKE", "TURNPK", "UNDERPASS", "UN", "UNION", "UNIONS", "VALLEY", "VALLY", "VLLY", "VLY", "VALLEYS", "VLYS", "VDCT", "VIA", "VIADCT", "VIADUCT", "VIEW", "VW", "VIEWS", "VWS", "VILL", "VILLAG", "VILLAGE", "VILLG", "VILLIAGE", "VLG", "VILLAGES", "VLGS", "VILLE", "VL", "VIS", "VIST", "VISTA", "VST", "VSTA", "WALK", "WALKS", "WALL", "WY", "WAY", "WAYS", "WELL", "WELLS"))
+"""Set of street suffixes accepted by USPS"""
 
-STREET_SUFFIX_MAPPING: dict[str, str] = {"ALLEE": "ALY", "ALLEY": "ALY", "ALLY": "ALY", "ALY": "ALY", "ANEX": "ANX", "ANNEX": "ANX", "ANNX": "ANX", "ANX": "ANX", "ARC": "ARC", "ARCADE": "ARC", "AV": "AVE", "AVE": "AVE", "AVEN": "AVE", "AVENU": "AVE", "AVENUE": "AVE", "AVN": "AVE", "AVNUE": "AVE", "BAYOO": "BYU", "BAYOU": "BYU", "BCH": "BCH", "BEACH": "BCH", "BEND": "BND", "BND": "BND", "BLF": "BLF", "BLUF": "BLF", "BLUFF": "BLF", "BLUFFS": "BLFS", "BOT": "BTM", "BTM": "BTM", "BOTTM": "BTM", "BOTTOM": "BTM", "BLVD": "BLVD", "BOUL": "BLVD", "BOULEVARD": "BLVD", "BOULV": "BLVD", "BR": "BR", "BRNCH": "BR", "BRANCH": "BR", "BRDGE": "BRG", "BRG": "BRG", "BRIDGE": "BRG", "BRK": "BRK", "BROOK": "BRK", "BROOKS": "BRKS", "BURG": "BG", "BURGS": "BGS", "BYP": "BYP", "BYPA": "BYP", "BYPAS": "BYP", "BYPASS": "BYP", "BYPS": "BYP", "CAMP": "CP", "CP": "CP", "CMP": "CP", "CANYN": "CYN", "CANYON": "CYN", "CNYN": "CYN", "CAPE": "CPE", "CPE": "CPE", "CAUSEWAY": "CSWY", "CAUSWA": "CSWY", "CSWY": "CSWY", "CEN": "CTR", "CENT": "CTR", "CENTER": "CTR", "CENTR": "CTR", "CENTRE": "CTR", "CNTER": "CTR", "CNTR": "CTR", "CTR": "CTR", "CENTERS": "CTRS", "CIR": "CIR", "CIRC": "CIR", "CIRCL": "CIR", "CIRCLE": "CIR", "CRCL": "CIR", "CRCLE": "CIR", "CIRCLES": "CIRS", "CLF": "CLF", "CLIFF": "CLF", "CLFS": "CLFS", "CLIFFS": "CLFS", "CLB": "CLB", "CLUB": "CLB", "COMMON": "CMN", "COMMONS": "CMNS", "COR": "COR", "CORNER": "COR", "CORNERS": "CORS", "CORS": "CORS", "COURSE": "CRSE", "CRSE": "CRSE", "COURT": "CT", "CT": "CT", "COURTS": "CTS", "CTS": "CTS", "COVE": "CV", "CV": "CV", "COVES": "CVS", "CREEK": "CRK", "CRK": "CRK", "CRESCENT": "CRES", "CRES": "CRES", "CRSENT": "CRES", "CRSNT": "CRES", "CREST": "CRST", "CROSSING": "XING", "CRSSNG": "XING", "XING": "XING", "CROSSROAD": "XRD", "CROSSROADS": "XRDS", "CURVE": "CURV", "DALE": "DL", "DL": "DL", "DAM": "DM", "DM": "DM", "DIV": "DV", "DIVIDE": "DV", "DV": "DV", "DVD": "DV", "DR": "DR", "DRIV": "DR", "DRIVE": "DR", "DRV": "DR", "DRIVES": "DRS", "EST": "EST", "ESTATE": "EST", "ESTATES": "ESTS", "ESTS": "ESTS", "EXP": "EXPY", "EXPR": "EXPY", "EXPRESS": "EXPY", "EXPRESSWAY": "EXPY", "EXPW": "EXPY", "EXPY": "EXPY", "EXT": "EXT", "EXTENSION": "EXT", "EXTN": "EXT", "EXTNSN": "EXT", "EXTS": "EXTS", "FALL": "FALL", "FALLS": "FLS", "FLS": "FLS", "FERRY": "FRY", "FRRY": "FRY", "FRY": "FRY", "FIELD": "FLD", "FLD": "FLD", "FIELDS": "FLDS", "FLDS": "FLDS", "FLAT": "FLT", "FLT": "FLT", "FLATS": "FLTS", "FLTS": "FLTS", "FORD": "FRD", "FRD": "FRD", "FORDS": "FRDS", "FOREST": "FRST", "FORESTS": "FRST", "FRST": "FRST", "FORG": "FRG", "FORGE": "FRG", "FRG": "FRG", "FORGES": "FRGS", "FORK": "FRK", "FRK": "FRK", "FORKS": "FRKS", "FRKS": "FRKS", "FORT": "FT", "FRT": "FT", "FT": "FT", "FREEWAY": "FWY", "FREEWY": "FWY", "FRWAY": "FWY", "FRWY": "FWY", "FWY": "FWY", "GARDEN": "GDN", "GARDN": "GDN", "GRDEN": "GDN", "GRDN": "GDN", "GARDENS": "GDNS", "GDNS": "GDNS", "GRDNS": "GDNS", "GATEWAY": "GTWY", "GATEWY": "GTWY", "GATWAY": "GTWY", "GTWAY": "GTWY", "GTWY": "GTWY", "GLEN": "GLN", "GLN": "GLN", "GLENS": "GLNS", "GREEN": "GRN", "GRN": "GRN", "GREENS": "GRNS", "GROV": "GRV", "GROVE": "GRV", "GRV": "GRV", "GROVES": "GRVS", "HARB": "HBR", "HARBOR": "HBR", "HARBR": "HBR", "HBR": "HBR", "HRBOR": "HBR", "HARBORS": "HBRS", "HAVEN": "HVN", "HVN": "HVN", "HT": "HTS", "HTS": "HTS", "HIGHWAY": "HWY", "HIGHWY": "HWY", "HIWAY": "HWY", "HIWY": "HWY", "HWAY": "HWY", "HWY": "HWY", "HILL": "HL", "HL": "HL", "HILLS": "HLS", "HLS": "HLS", "HLLW": "HOLW", "HOLLOW": "HOLW", "HOLLOWS": "HOLW", "HOLW": "HOLW", "HOLWS": "HOLW", "INLT": "INLT", "IS": "IS", "ISLAND": "IS", "ISLND": "IS", "ISLANDS": "ISS", "ISLNDS": "ISS", "ISS": "ISS", "ISLE": "ISLE", "ISLES": "ISLE", "JCT": "JCT", "JCTION": "JCT", "JCTN": "JCT", "JUNCTION": "JCT", "JUNCTN": "JCT", "JUNCTON": "JCT", "JCTNS": "JCTS", "JCTS": "JCTS", "JUNCTIONS": "JCTS", "KEY": "KY", "KY": "KY", "KEYS": "KYS", "KYS": "KYS", "KNL": "KNL", "KNOL": "KNL", "KNOLL": "KNL", "KNLS": "KNLS", "KNOLLS": "KNLS", "LK": "LK", "LAKE": "LK", "LKS": "LKS", "LAKES": "LKS", "LAND": "LAND", "LANDING": "LNDG", "LNDG": "LNDG", "LNDNG": "LNDG", "LANE": "LN", "LN": "LN", "LGT": "LGT", "LIGHT": "LGT", "LIGHTS": "LGTS", "LF": "LF", "LOAF": "LF", "LCK": "LCK", "LOCK": "LCK", "LCKS": "LCKS", "LOCKS": "LCKS", "LDG": "LDG", "LDGE": "LDG", "LODG": "LDG", "LODGE": "LDG", "LOOP": "LOOP", "LOOPS": "LOOP", "MALL": "MALL", "MNR": "MNR", "MANOR": "MNR", "MANORS": "MNRS", "MNRS": "MNRS", "MEADOW": "MDW", "MDW": "MDWS", "MDWS": "MDWS", "MEADOWS": "MDWS", "MEDOWS": "MDWS", "MEWS": "MEWS", "MILL": "ML", "MILLS": "MLS", "MISSN": "MSN", "MSSN": "MSN", "MOTORWAY": "MTWY", "MNT": "MT", "MT": "MT", "MOUNT": "MT", "MNTAIN": "MTN", "MNTN": "MTN", "MOUNTAIN": "MTN", "MOUNTIN": "MTN", "MTIN": "MTN", "MTN": "MTN", "MNTNS": "MTNS", "MOUNTAINS": "MTNS", "NCK": "NCK", "NECK": "NCK", "ORCH": "ORCH", "ORCHARD": "ORCH", "ORCHRD": "ORCH", "OVAL": "OVAL", "OVL": "OVAL", "OVERPASS": "OPAS", "PARK": "PARK", "PRK": "PARK", "PARKS": "PARK", "PARKWAY": "PKWY", "PARKWY": "PKWY", "PKWAY": "PKWY", "PKWY": "PKWY", "PKY": "PKWY", "PARKWAYS": "PKWY", "PKWYS": "PKWY", "PASS": "PASS", "PASSAGE": "PSGE", "PATH": "PATH", "PATHS": "PATH", "PIKE": "PIKE", "PIKES": "PIKE", "PINE": "PNE", "PINES": "PNES", "PNES": "PNES", "PL": "PL", "PLAIN": "PLN", "PLN": "PLN", "PLAINS": "PLNS", "PLNS": "PLNS", "PLAZA": "PLZ", "PLZ": "PLZ", "PLZA": "PLZ", "POINT": "PT", "PT": "PT", "POINTS": "PTS", "PTS": "PTS", "PORT": "PRT", "PRT": "PRT", "PORTS": "PRTS", "PRTS": "PRTS", "PR": "PR", "PRAIRIE": "PR", "PRR": "PR", "RAD": "RADL", "RADIAL": "RADL", "RADIEL": "RADL", "RADL": "RADL", "RAMP": "RAMP", "RANCH": "RNCH", "RANCHES": "RNCH", "RNCH": "RNCH", "RNCHS": "RNCH", "RAPID": "RPD", "RPD": "RPD", "RAPIDS": "RPDS", "RPDS": "RPDS", "REST": "RST", "RST": "RST", "RDG": "RDG", "RDGE": "RDG", "RIDGE": "RDG", "RDGS": "RDGS", "RIDGES": "RDGS", "RIV": "RIV", "RIVER": "RIV", "RVR": "RIV", "RIVR": "RIV", "RD": "RD", "ROAD": "RD", "ROADS": "RDS", "RDS": "RDS", "ROUTE": "RTE", "ROW": "ROW", "RUE": "RUE", "RUN": "RUN", "SHL": "SHL", "SHOAL": "SHL", "SHLS": "SHLS", "SHOALS": "SHLS", "SHOAR": "SHR", "SHORE": "SHR", "SHR": "SHR", "SHOARS": "SHRS", "SHORES": "SHRS", "SHRS": "SHRS", "SKYWAY": "SKWY", "SPG": "SPG", "SPNG": "SPG", "SPRING": "SPG", "SPRNG": "SPG", "SPGS": "SPGS", "SPNGS": "SPGS", "SPRINGS": "SPGS", "SPRNGS": "SPGS", "SPUR": "SPUR", "SPURS": "SPUR", "SQ": "SQ", "SQR": "SQ", "SQRE": "SQ", "SQU": "SQ", "SQUARE": "SQ", "SQRS": "SQS", "SQUARES": "SQS", "STA": "STA", "STATION": "STA", "STATN": "STA", "STN": "STA", "STRA": "STRA", "STRAV": "STRA", "STRAVEN": "STRA", "STRAVENUE": "STRA", "STRAVN": "STRA", "STRVN": "STRA", "STRVNUE": "STRA", "STREAM": "STRM", "STREME": "STRM", "STRM": "STRM", "STREET": "ST", "STRT": "ST", "ST": "ST", "STR": "ST", "STREETS": "STS", "SMT": "SMT", "SUMIT": "SMT", "SUMITT": "SMT", "SUMMIT": "SMT", "TER": "TER", "TERR": "TER", "TERRACE": "TER", "THROUGHWAY": "TRWY", "TRACE": "TRCE", "TRACES": "TRCE", "TRCE": "TRCE", "TRACK": "TRAK", "TRACKS": "TRAK", "TRAK": "TRAK", "TRK": "TRAK", "TRKS": "TRAK", "TRAFFICWAY": "TRFY", "TRAIL": "TRL", "TRAILS": "TRL", "TRL": "TRL", "TRLS": "TRL", "TRAILER": "TRLR", "TRLR": "TRLR", "TRLRS": "TRLR", "TUNEL": "TUNL", "TUNL": "TUNL", "TUNLS": "TUNL", "TUNNEL": "TUNL", "TUNNELS": "TUNL", "TUNNL": "TUNL", "TRNPK": "TPKE", "TURNPIKE": "TPKE", "TURNPK": "TPKE", "UNDERPASS": "UPAS", "UN": "UN", "UNION": "UN", "UNIONS": "UNS", "VALLEY": "VLY", "VALLY": "VLY", "VLLY": "VLY", "VLY": "VLY", "VALLEYS": "VLYS", "VLYS": "VLYS", "VDCT": "VIA", "VIA": "VIA", "VIADCT": "VIA", "VIADUCT": "VIA", "VIEW": "VW", "VW": "VW", "VIEWS": "VWS", "VWS": "VWS", "VILL": "VLG", "VILLAG": "VLG", "VILLAGE": "VLG", "VILLG": "VLG", "VILLIAGE": "VLG", "VLG": "VLG", "VILLAGES": "VLGS", "VLGS": "VLGS", "VILLE": "VL", "VL": "VL", "VIS": "VIS", "VIST": "VIS", "VISTA": "VIS", "VST": "VIS", "VSTA": "VIS", "WALK": "WALK", "WALKS": "WALK", "WALL": "WALL", "WY": "WAY", "WAY": "WAY", "WAYS": "WAYS", "WELL": "WL", "WELLS": "WLS", "WLS": "WLS"}
+STREET_SUFFIX_MAPPING: Mapping[str, str] = {"ALLEE": "ALY", "ALLEY": "ALY", "ALLY": "ALY", "ALY": "ALY", "ANEX": "ANX", "ANNEX": "ANX", "ANNX": "ANX", "ANX": "ANX", "ARC": "ARC", "ARCADE": "ARC", "AV": "AVE", "AVE": "AVE", "AVEN": "AVE", "AVENU": "AVE", "AVENUE": "AVE", "AVN": "AVE", "AVNUE": "AVE", "BAYOO": "BYU", "BAYOU": "BYU", "BCH": "BCH", "BEACH": "BCH", "BEND": "BND", "BND": "BND", "BLF": "BLF", "BLUF": "BLF", "BLUFF": "BLF", "BLUFFS": "BLFS", "BOT": "BTM", "BTM": "BTM", "BOTTM": "BTM", "BOTTOM": "BTM", "BLVD": "BLVD", "BOUL": "BLVD", "BOULEVARD": "BLVD", "BOULV": "BLVD", "BR": "BR", "BRNCH": "BR", "BRANCH": "BR", "BRDGE": "BRG", "BRG": "BRG", "BRIDGE": "BRG", "BRK": "BRK", "BROOK": "BRK", "BROOKS": "BRKS", "BURG": "BG", "BURGS": "BGS", "BYP": "BYP", "BYPA": "BYP", "BYPAS": "BYP", "BYPASS": "BYP", "BYPS": "BYP", "CAMP": "CP", "CP": "CP", "CMP": "CP", "CANYN": "CYN", "CANYON": "CYN", "CNYN": "CYN", "CAPE": "CPE", "CPE": "CPE", "CAUSEWAY": "CSWY", "CAUSWA": "CSWY", "CSWY": "CSWY", "CEN": "CTR", "CENT": "CTR", "CENTER": "CTR", "CENTR": "CTR", "CENTRE": "CTR", "CNTER": "CTR", "CNTR": "CTR", "CTR": "CTR", "CENTERS": "CTRS", "CIR": "CIR", "CIRC": "CIR", "CIRCL": "CIR", "CIRCLE": "CIR", "CRCL": "CIR", "CRCLE": "CIR", "CIRCLES": "CIRS", "CLF": "CLF", "CLIFF": "CLF", "CLFS": "CLFS", "CLIFFS": "CLFS", "CLB": "CLB", "CLUB": "CLB", "COMMON": "CMN", "COMMONS": "CMNS", "COR": "COR", "CORNER": "COR", "CORNERS": "CORS", "CORS": "CORS", "COURSE": "CRSE", "CRSE": "CRSE", "COURT": "CT", "CT": "CT", "COURTS": "CTS", "CTS": "CTS", "COVE": "CV", "CV": "CV", "COVES": "CVS", "CREEK": "CRK", "CRK": "CRK", "CRESCENT": "CRES", "CRES": "CRES", "CRSENT": "CRES", "CRSNT": "CRES", "CREST": "CRST", "CROSSING": "XING", "CRSSNG": "XING", "XING": "XING", "CROSSROAD": "XRD", "CROSSROADS": "XRDS", "CURVE": "CURV", "DALE": "DL", "DL": "DL", "DAM": "DM", "DM": "DM", "DIV": "DV", "DIVIDE": "DV", "DV": "DV", "DVD": "DV", "DR": "DR", "DRIV": "DR", "DRIVE": "DR", "DRV": "DR", "DRIVES": "DRS", "EST": "EST", "ESTATE": "EST", "ESTATES": "ESTS", "ESTS": "ESTS", "EXP": "EXPY", "EXPR": "EXPY", "EXPRESS": "EXPY", "EXPRESSWAY": "EXPY", "EXPW": "EXPY", "EXPY": "EXPY", "EXT": "EXT", "EXTENSION": "EXT", "EXTN": "EXT", "EXTNSN": "EXT", "EXTS": "EXTS", "FALL": "FALL", "FALLS": "FLS", "FLS": "FLS", "FERRY": "FRY", "FRRY": "FRY", "FRY": "FRY", "FIELD": "FLD", "FLD": "FLD", "FIELDS": "FLDS", "FLDS": "FLDS", "FLAT": "FLT", "FLT": "FLT", "FLATS": "FLTS", "FLTS": "FLTS", "FORD": "FRD", "FRD": "FRD", "FORDS": "FRDS", "FOREST": "FRST", "FORESTS": "FRST", "FRST": "FRST", "FORG": "FRG", "FORGE": "FRG", "FRG": "FRG", "FORGES": "FRGS", "FORK": "FRK", "FRK": "FRK", "FORKS": "FRKS", "FRKS": "FRKS", "FORT": "FT", "FRT": "FT", "FT": "FT", "FREEWAY": "FWY", "FREEWY": "FWY", "FRWAY": "FWY", "FRWY": "FWY", "FWY": "FWY", "GARDEN": "GDN", "GARDN": "GDN", "GRDEN": "GDN", "GRDN": "GDN", "GARDENS": "GDNS", "GDNS": "GDNS", "GRDNS": "GDNS", "GATEWAY": "GTWY", "GATEWY": "GTWY", "GATWAY": "GTWY", "GTWAY": "GTWY", "GTWY": "GTWY", "GLEN": "GLN", "GLN": "GLN", "GLENS": "GLNS", "GREEN": "GRN", "GRN": "GRN", "GREENS": "GRNS", "GROV": "GRV", "GROVE": "GRV", "GRV": "GRV", "GROVES": "GRVS", "HARB": "HBR", "HARBOR": "HBR", "HARBR": "HBR", "HBR": "HBR", "HRBOR": "HBR", "HARBORS": "HBRS", "HAVEN": "HVN", "HVN": "HVN", "HT": "HTS", "HTS": "HTS", "HIGHWAY": "HWY", "HIGHWY": "HWY", "HIWAY": "HWY", "HIWY": "HWY", "HWAY": "HWY", "HWY": "HWY", "HILL": "HL", "HL": "HL", "HILLS": "HLS", "HLS": "HLS", "HLLW": "HOLW", "HOLLOW": "HOLW", "HOLLOWS": "HOLW", "HOLW": "HOLW", "HOLWS": "HOLW", "INLT": "INLT", "IS": "IS", "ISLAND": "IS", "ISLND": "IS", "ISLANDS": "ISS", "ISLNDS": "ISS", "ISS": "ISS", "ISLE": "ISLE", "ISLES": "ISLE", "JCT": "JCT", "JCTION": "JCT", "JCTN": "JCT", "JUNCTION": "JCT", "JUNCTN": "JCT", "JUNCTON": "JCT", "JCTNS": "JCTS", "JCTS": "JCTS", "JUNCTIONS": "JCTS", "KEY": "KY", "KY": "KY", "KEYS": "KYS", "KYS": "KYS", "KNL": "KNL", "KNOL": "KNL", "KNOLL": "KNL", "KNLS": "KNLS", "KNOLLS": "KNLS", "LK": "LK", "LAKE": "LK", "LKS": "LKS", "LAKES": "LKS", "LAND": "LAND", "LANDING": "LNDG", "LNDG": "LNDG", "LNDNG": "LNDG", "LANE": "LN", "LN": "LN", "LGT": "LGT", "LIGHT": "LGT", "LIGHTS": "LGTS", "LF": "LF", "LOAF": "LF", "LCK": "LCK", "LOCK": "LCK", "LCKS": "LCKS", "LOCKS": "LCKS", "LDG": "LDG", "LDGE": "LDG", "LODG": "LDG", "LODGE": "LDG", "LOOP": "LOOP", "LOOPS": "LOOP", "MALL": "MALL", "MNR": "MNR", "MANOR": "MNR", "MANORS": "MNRS", "MNRS": "MNRS", "MEADOW": "MDW", "MDW": "MDWS", "MDWS": "MDWS", "MEADOWS": "MDWS", "MEDOWS": "MDWS", "MEWS": "MEWS", "MILL": "ML", "MILLS": "MLS", "MISSN": "MSN", "MSSN": "MSN", "MOTORWAY": "MTWY", "MNT": "MT", "MT": "MT", "MOUNT": "MT", "MNTAIN": "MTN", "MNTN": "MTN", "MOUNTAIN": "MTN", "MOUNTIN": "MTN", "MTIN": "MTN", "MTN": "MTN", "MNTNS": "MTNS", "MOUNTAINS": "MTNS", "NCK": "NCK", "NECK": "NCK", "ORCH": "ORCH", "ORCHARD": "ORCH", "ORCHRD": "ORCH", "OVAL": "OVAL", "OVL": "OVAL", "OVERPASS": "OPAS", "PARK": "PARK", "PRK": "PARK", "PARKS": "PARK", "PARKWAY": "PKWY", "PARKWY": "PKWY", "PKWAY": "PKWY", "PKWY": "PKWY", "PKY": "PKWY", "PARKWAYS": "PKWY", "PKWYS": "PKWY", "PASS": "PASS", "PASSAGE": "PSGE", "PATH": "PATH", "PATHS": "PATH", "PIKE": "PIKE", "PIKES": "PIKE", "PINE": "PNE", "PINES": "PNES", "PNES": "PNES", "PL": "PL", "PLAIN": "PLN", "PLN": "PLN", "PLAINS": "PLNS", "PLNS": "PLNS", "PLAZA": "PLZ", "PLZ": "PLZ", "PLZA": "PLZ", "POINT": "PT", "PT": "PT", "POINTS": "PTS", "PTS": "PTS", "PORT": "PRT", "PRT": "PRT", "PORTS": "PRTS", "PRTS": "PRTS", "PR": "PR", "PRAIRIE": "PR", "PRR": "PR", "RAD": "RADL", "RADIAL": "RADL", "RADIEL": "RADL", "RADL": "RADL", "RAMP": "RAMP", "RANCH": "RNCH", "RANCHES": "RNCH", "RNCH": "RNCH", "RNCHS": "RNCH", "RAPID": "RPD", "RPD": "RPD", "RAPIDS": "RPDS", "RPDS": "RPDS", "REST": "RST", "RST": "RST", "RDG": "RDG", "RDGE": "RDG", "RIDGE": "RDG", "RDGS": "RDGS", "RIDGES": "RDGS", "RIV": "RIV", "RIVER": "RIV", "RVR": "RIV", "RIVR": "RIV", "RD": "RD", "ROAD": "RD", "ROADS": "RDS", "RDS": "RDS", "ROUTE": "RTE", "ROW": "ROW", "RUE": "RUE", "RUN": "RUN", "SHL": "SHL", "SHOAL": "SHL", "SHLS": "SHLS", "SHOALS": "SHLS", "SHOAR": "SHR", "SHORE": "SHR", "SHR": "SHR", "SHOARS": "SHRS", "SHORES": "SHRS", "SHRS": "SHRS", "SKYWAY": "SKWY", "SPG": "SPG", "SPNG": "SPG", "SPRING": "SPG", "SPRNG": "SPG", "SPGS": "SPGS", "SPNGS": "SPGS", "SPRINGS": "SPGS", "SPRNGS": "SPGS", "SPUR": "SPUR", "SPURS": "SPUR", "SQ": "SQ", "SQR": "SQ", "SQRE": "SQ", "SQU": "SQ", "SQUARE": "SQ", "SQRS": "SQS", "SQUARES": "SQS", "STA": "STA", "STATION": "STA", "STATN": "STA", "STN": "STA", "STRA": "STRA", "STRAV": "STRA", "STRAVEN": "STRA", "STRAVENUE": "STRA", "STRAVN": "STRA", "STRVN": "STRA", "STRVNUE": "STRA", "STREAM": "STRM", "STREME": "STRM", "STRM": "STRM", "STREET": "ST", "STRT": "ST", "ST": "ST", "STR": "ST", "STREETS": "STS", "SMT": "SMT", "SUMIT": "SMT", "SUMITT": "SMT", "SUMMIT": "SMT", "TER": "TER", "TERR": "TER", "TERRACE": "TER", "THROUGHWAY": "TRWY", "TRACE": "TRCE", "TRACES": "TRCE", "TRCE": "TRCE", "TRACK": "TRAK", "TRACKS": "TRAK", "TRAK": "TRAK", "TRK": "TRAK", "TRKS": "TRAK", "TRAFFICWAY": "TRFY", "TRAIL": "TRL", "TRAILS": "TRL", "TRL": "TRL", "TRLS": "TRL", "TRAILER": "TRLR", "TRLR": "TRLR", "TRLRS": "TRLR", "TUNEL": "TUNL", "TUNL": "TUNL", "TUNLS": "TUNL", "TUNNEL": "TUNL", "TUNNELS": "TUNL", "TUNNL": "TUNL", "TRNPK": "TPKE", "TURNPIKE": "TPKE", "TURNPK": "TPKE", "UNDERPASS": "UPAS", "UN": "UN", "UNION": "UN", "UNIONS": "UNS", "VALLEY": "VLY", "VALLY": "VLY", "VLLY": "VLY", "VLY": "VLY", "VALLEYS": "VLYS", "VLYS": "VLYS", "VDCT": "VIA", "VIA": "VIA", "VIADCT": "VIA", "VIADUCT": "VIA", "VIEW": "VW", "VW": "VW", "VIEWS": "VWS", "VWS": "VWS", "VILL": "VLG", "VILLAG": "VLG", "VILLAGE": "VLG", "VILLG": "VLG", "VILLIAGE": "VLG", "VLG": "VLG", "VILLAGES": "VLGS", "VLGS": "VLGS", "VILLE": "VL", "VL": "VL", "VIS": "VIS", "VIST": "VIS", "VISTA": "VIS", "VST": "VIS", "VSTA": "VIS", "WALK": "WALK", "WALKS": "WALK", "WALL": "WALL", "WY": "WAY", "WAY": "WAY", "WAYS": "WAYS", "WELL": "WL", "WELLS": "WLS", "WLS": "WLS"}
 """Mapping of street suffix variations to their preferred abbreviation"""
 
+# Intern every string in the tables above, so that lookups and comparisons against them can short-circuit on identity.
+# The mappings are also made read-only, since they are shared by every caller of the module.
+DIRECTIONS_LIST = frozenset(sys.intern(x) for x in DIRECTIONS_LIST)
+DIRECTIONS_MAPPING = types.MappingProxyType({sys.intern(k): sys.intern(v) for k, v in DIRECTIONS_MAPPING.items()})
+HIGHWAY_MAPPING = types.MappingProxyType({sys.intern(k): sys.intern(v) for k, v in HIGHWAY_MAPPING.items()})
+SECONDARY_UNIT_INDICATORS = frozenset(sys.intern(x) for x in SECONDARY_UNIT_INDICATORS)
+STATE_NAME_MAPPING = types.MappingProxyType({sys.intern(k): sys.intern(v) for k, v in STATE_NAME_MAPPING.items()})
+STREET_SUFFIXES = frozenset(sys.intern(x) for x in STREET_SUFFIXES)
+_STREET_SUFFIX_MAPPING: dict[str, str] = {sys.intern(k): sys.intern(v) for k, v in STREET_SUFFIX_MAPPING.items()}
+"""Plain dictionary behind STREET_SUFFIX_MAPPING, read by Address.parse() since lookups through the read-only view are slower"""
+STREET_SUFFIX_MAPPING = types.MappingProxyType(_STREET_SUFFIX_MAPPING)
+
+_DIRECTIONS_CANONICAL: dict[str, str] = {x: DIRECTIONS_MAPPING.get(x, x) for x in DIRECTIONS_LIST}
+"""Mapping of every direction in DIRECTIONS_LIST (abbreviated or not) to its USPS-preferred abbreviation"""
+
+_WORD_KIND_SUFFIX: int = 1
+"""Bit set in _WORD_KINDS for words in STREET_SUFFIXES"""
+_WORD_KIND_UNIT: int = 2
+"""Bit set in _WORD_KINDS for words in SECONDARY_UNIT_INDICATORS"""
+
+_WORD_KINDS: dict[str, int] = {x: (_WORD_KIND_SUFFIX if x in STREET_SUFFIXES else 0) |
+        (_WORD_KIND_UNIT if x in SECONDARY_UNIT_INDICATORS else 0) for x in STREET_SUFFIXES | SECONDARY_UNIT_INDICATORS}
+"""
+Mapping of every street suffix and secondary unit indicator to the _WORD_KIND_* bits describing it, so that a word can be
+classified with a single lookup. Some words, such as "KEY", are both. Used internally by Address.parse()
+"""
+
+_DELIVERY_ADDRESS_TOKEN_REGEX: re.Pattern = re.compile(
+        r"(?P<NUMBER>[0-9]+(?![A-Za-z0-9\-./]))"
+        r"|(?P<DECIMAL>[0-9]+\.[0-9]*(?![A-Za-z0-9\-./]))"
+        r"|(?P<FRACTION>[0-9]+/[0-9]*(?![A-Za-z0-9\-./]))"
+        r"|(?P<NUMBERSUFFIXED>[0-9][A-Za-z0-9\-./]*)"
+        r"|(?P<WORD>[A-Za-z][A-Za-z0-9\-./]*)"
+        r"|(?P<POUND>#)"
+        r"|(?P<SPECIAL>[\-./][A-Za-z0-9\-./]*)")
+"""
+Regex matching a single token of a delivery address, where the name of the matching group is the name of the token's _TokenType.
+Used internally by Address._lex_delivery_address()
+"""
+
+_DELIVERY_ADDRESS_SEPARATOR_TABLE: dict[int, str] = str.maketrans({chr(c): " " for c in range(256)
+        if chr(c) not in "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789#-./"})
+"""Translation table replacing every non-parsed character below U+0100 with a space. Used internally by Address._lex_delivery_address()"""
+
+class _CharacterFilter(dict):
+    """
+    Translation table for str.translate() that deletes every character except the given ones, and optionally replaces
+    whitespace with spaces. The ASCII characters are translated by a table built up front. Other characters are classified
+    each time they are looked up, and are not stored, so that the table stays small no matter what input it is given. Should
+    not be accessed outside of the addressutil module.
+    """
+    def __init__(self, kept_characters: str, replace_whitespace: bool):
+        """
+        :param kept_characters: The characters that are left as is by the table.
+        :param replace_whitespace: Whether to replace whitespace with spaces, instead of deleting it.
+        """
+        ascii_characters: str = "".join(map(chr, range(128)))
+        whitespace: str = "".join(character for character in ascii_characters
+                if replace_whitespace and character.isspace() and character not in kept_characters)
+        deleted: str = "".join(character for character in ascii_characters
+                if character not in kept_characters and character not in whitespace)
+        super().__init__(str.maketrans(whitespace, " " * len(whitespace), deleted))
+        self.__kept_characters: str = kept_characters
+        self.__replace_whitespace: bool = replace_whitespace
+    
+    def __missing__(self, ordinal: int) -> Optional[int]:
+        character: str = chr(ordinal)
+        if character in self.__kept_characters:
+            return ordinal
+        if self.__replace_whitespace and character.isspace():
+            return ord(" ")
+        return None
+
+_LAST_LINE_FILTER: _CharacterFilter = _CharacterFilter("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-", True)
+"""Translation table for the last line of an address, which turns whitespace into spaces and silently drops other non-alphanumeric characters"""
+
+_ALPHANUMERIC_FILTER: _CharacterFilter = _CharacterFilter("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789", False)
+"""Translation table that drops every character except ASCII letters and digits. Used internally by Address.parse()"""
+
+_ALPHABETIC_FILTER: _CharacterFilter = _CharacterFilter("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz", False)
+"""Translation table that drops every character except ASCII letters. Used internally by Address.parse()"""
+
+_HIGHWAY_NAME_TRIE: dict = {}
+"""
+Trie of the words in each highway name from HIGHWAY_MAPPING, used to match multi-word highway names in a single pass. Each node is
+a dictionary from the next word to the child node, and the standardized highway name is stored under the key None.
+"""
+for _highway_name, _standardized_highway_name in HIGHWAY_MAPPING.items():
+    _node = _HIGHWAY_NAME_TRIE
+    for _word in _highway_name.split():
+        _node = _node.setdefault(_word, {})
+    _node[None] = _standardized_highway_name
+del _highway_name, _standardized_highway_name, _node, _word
+
 class AddressParseError(RuntimeError):
     """
     Raised when the parsing of an address string failed.
@@ -56,49 +159,67 @@ class AddressParseError(RuntimeError):
         :param address_string: Original address string, to provide a reference as to the location of the error.
         :param index: The index in the address string at which the parse error occured.
         """
-        output_string = "Error parsing address at index " + str(index) + " (" + description + "), near:\n"
-        output_string += address_string + '\n'
-        output_string += (' ' * index) + "^\n"
-        super().__init__(output_string)
+        super().__init__(f"Error parsing address at index {index} ({description}), near:\n{address_string}\n{' ' * index}^\n")
+        self.description = description
+        self.address_string = address_string
         self.index = index
     
     def __reduce__(self):
         # Make the exception pickleable, just in case,
-        return (AddressParseError, (self.message, self.index))
+        return (AddressParseError, (self.description, self.address_string, self.index))
 
 
-class _AddressToken:
+class _TokenType(enum.IntEnum):
     """
-    Represents a token used during the parsing of an address. Should not be accessed outside
+    Represents the type of a token used during the parsing of an address. Should not be accessed outside
     of the addressutil module, unless you really know what you are doing.
     """
-    TYPE_DECIMAL = "decimal"
+    DECIMAL = 0
     """Represents a decimal number"""
-    TYPE_FRACTION = "fraction"
+    FRACTION = 1
     """Represents a fractional number"""
-    TYPE_NUMBER = "number"
+    NUMBER = 2
     """Represents a nonnegative integer"""
-    TYPE_NUMBERSUFFIXED = "numbersuffixed"
+    NUMBERSUFFIXED = 3
     """Represents a number suffixed with a non-numeric character"""
-    TYPE_POUND = "pound"
+    POUND = 4
     """Represents the pound sign (#)"""
-    TYPE_SPECIAL = "special"
+    SPECIAL = 5
     """Represents a token that begins with a nonalphanumeric character"""
-    TYPE_WORD = "word"
+    WORD = 6
     """Represents a alphanumeric word beginning with a letter"""
+
+
+class _AddressToken(NamedTuple):
+    """
+    Represents a token used during the parsing of an address. Should not be accessed outside
+    of the addressutil module, unless you really know what you are doing.
+    """
+    literal: str
+    """The literal value of the token."""
+    type_: _TokenType
+    """The type of the token."""
+    index: int
+    """The index of the token in the original string."""
     
-    def __init__(self, literal: str, type_: str, index: int):
-        """
-        :param literal: The literal value of the token.
-        :param type_: The type of the token.
-        :param index: The index of the token in the original string. Should be an integer.
-        """
-        self.literal: str = literal
-        self.type_: str = type_
-        self.index: int = index
+    # Shorthands for the members of _TokenType. See the documentation for _TokenType.
+    TYPE_DECIMAL = _TokenType.DECIMAL
+    TYPE_FRACTION = _TokenType.FRACTION
+    TYPE_NUMBER = _TokenType.NUMBER
+    TYPE_NUMBERSUFFIXED = _TokenType.NUMBERSUFFIXED
+    TYPE_POUND = _TokenType.POUND
+    TYPE_SPECIAL = _TokenType.SPECIAL
+    TYPE_WORD = _TokenType.WORD
     
     def __repr__(self) -> str:
-        return "addressutil._AddressToken(literal=" + self.literal + ", type_=" + self.type_ + ", index=" + repr(self.index) + ")"
+        return f"addressutil._AddressToken(literal={self.literal}, type_={self.type_!r}, index={self.index!r})"
+
+
+_NUMERIC_TOKEN_TYPES: frozenset[_TokenType] = frozenset((_TokenType.DECIMAL, _TokenType.FRACTION, _TokenType.NUMBER))
+"""Set of token types that can be the address number of a standard address. Used internally by Address.parse()"""
+
+_HIGHWAY_NUMBER_TOKEN_TYPES: frozenset[_TokenType] = frozenset((_TokenType.NUMBER, _TokenType.NUMBERSUFFIXED))
+"""Set of token types that can follow a highway name, like 75 or 238A, for it to be standardized. Used internally by Address.parse()"""
 
 
 class Address:
@@ -113,6 +234,8 @@ class Address:
     
     # TODO Support private mailbox (PMB) designations in the base Address class.
     
+    __slots__ = ("__city", "__state", "__zipcode", "__zipcode_ext", "__zipcode_full", "_key", "_hash")
+    
     def __init__(self, city: str, state: str, zipcode: str, zipcode_ext: Optional[str]):
         """
         **Caution:** Do NOT initialize Address directly unless you know what you are doing! Initializing this class directly
@@ -126,17 +249,29 @@ class Address:
         :raises ValueError: If parameter "state" is not 2 characters long.
         """
         if len(state) != 2:
-            raise ValueError("Invalid value \"" + str(state) + "\" for the state - Use the 2-letter FIPS abbreviation for the state, " + 
+            raise ValueError(f"Invalid value \"{state}\" for the state - Use the 2-letter FIPS abbreviation for the state, "
                     "not the full state name or any other abbreviation.")
         if len(zipcode) != 5:
-            raise ValueError("Invalid value \"" + str(zipcode) + "\" for the zip code - Parameter \"zipcode\" should be 5 digits long. " + 
+            raise ValueError(f"Invalid value \"{zipcode}\" for the zip code - Parameter \"zipcode\" should be 5 digits long. "
                     "Use the parameter \"zipcode_ext\" to store the extended zipcode.")
         if zipcode_ext is not None and len(zipcode_ext) != 4:
-            raise ValueError("Parameter \"zipcode_ext\" should either be None or 4 digits long, not \"" + str(zipcode_ext) + "\"")
-        self.__city: str = city.upper()
-        self.__state: str = state.upper()
-        self.__zipcode: str = zipcode.upper()
-        self.__zipcode_ext: Optional[str] = None if zipcode_ext is None else zipcode_ext.upper()
+            raise ValueError(f"Parameter \"zipcode_ext\" should either be None or 4 digits long, not \"{zipcode_ext}\"")
+        # Addresses from Address.parse() are already in uppercase, so avoid making a copy of the string when possible.
+        # sys.intern() only accepts plain strings, so str subclasses (such as numpy.str_) are converted first. Other types are left
+        # as is, so that they still fail below.
+        if type(city) is not str and isinstance(city, str):
+            city = str(city)
+        if type(state) is not str and isinstance(state, str):
+            state = str(state)
+        self.__city: str = sys.intern(city if city.isupper() else city.upper())
+        self.__state: str = sys.intern(state if state.isupper() else state.upper())
+        self.__zipcode: str = sys.intern(zipcode.upper())
+        self.__zipcode_ext: Optional[str] = None if zipcode_ext is None else sys.intern(zipcode_ext.upper())
+        self.__zipcode_full: str = self.__zipcode if self.__zipcode_ext is None else f"{self.__zipcode}-{self.__zipcode_ext}"
+        # Every field that identifies the address, compared by __eq__() and hashed by __hash__(). Subclasses append their own fields.
+        self._key: tuple[Optional[str], ...] = (self.type_, self.__city, self.__state, self.__zipcode, self.__zipcode_ext)
+        # Hash of _key, computed the first time the address is hashed (after subclasses have finished building _key).
+        self._hash: Optional[int] = None
     
     @property
     def city(self) -> str:
@@ -164,9 +299,7 @@ class Address:
         """
         The full ZIP+4 ZIP code of the address. If the extended ZIP code is not specified, will return the 5-digit ZIP code.
         """
-        if self.__zipcode_ext is None:
-            return self.__zipcode
-        return self.__zipcode + "-" + self.__zipcode_ext
+        return self.__zipcode_full
     
     @staticmethod
     def _lex_delivery_address(delivery_address: str) -> list[_AddressToken]:
@@ -175,65 +308,56 @@ class Address:
         
         :return: List of Address tokens
         """
-        output_tokens: list[_AddressToken] = []
-        
-        current_position: int = 0  # The character we are currently on within the delivery address
-        current_token: Optional[_AddressToken] = None
-        while current_position < len(delivery_address):
-            if delivery_address[current_position] == "\n":
-                raise AddressParseError("unexpected newline", delivery_address, current_position)
-            if current_token is None:
-                # No current token.
-                if re.match(r"[^A-Za-z0-9#\-\.\/]", delivery_address[current_position]):
-                    # We encountered another non-parsed character. Do nothing.
-                    pass
-                elif re.match(r"\d", delivery_address[current_position]):
-                    # Begins with a number. Assume it is a number for now, although it could change.
-                    current_token = _AddressToken(delivery_address[current_position], _AddressToken.TYPE_NUMBER, current_position)
-                elif re.match(r"[A-Za-z]", delivery_address[current_position]):
-                    # Begins with alphabetic character
-                    current_token = _AddressToken(delivery_address[current_position], _AddressToken.TYPE_WORD, current_position)
-                elif re.match(r"#", delivery_address[current_position]):
-                    # The pound sign is a special token that will only ever consist of a single pound sign.
-                    output_tokens.append(_AddressToken(delivery_address[current_position], _AddressToken.TYPE_POUND, current_position))
-                else:
-                    # Begins with hyphen, period, or forward slash,
-                    current_token = _AddressToken(delivery_address[current_position], _AddressToken.TYPE_SPECIAL, current_position)
-            else:
-                if re.match(r"[^A-Za-z0-9\-\.\/]", delivery_address[current_position]):
-                    # We encountered a non-parsed character. Terminate the current token.
-                    output_tokens.append(current_token)
-                    current_token = None
-                    
-                    # Also terminate the token if we encounter a pound (#) sign.
-                    # However, we also want to add the pound sign in as a separate token.
-                    if re.match(r"#", delivery_address[current_position]):
-                        # Special pound sign token.
-                        output_tokens.append(_AddressToken(delivery_address[current_position], _AddressToken.TYPE_POUND, current_position))
+        # A newline can never be part of another token, so the first one is always where lexing would fail.
+        newline_index: int = delivery_address.find("\n")
+        if newline_index != -1:
+            raise AddressParseError("unexpected newline", delivery_address, newline_index)
+        
+        # Fast path: Most addresses only contain words, plain numbers, and separators. For those, the tokens are exactly what
+        # is left after turning every non-parsed character into a space, so there is no need for the regex below.
+        separated_address: str = delivery_address.translate(_DELIVERY_ADDRESS_SEPARATOR_TABLE)
+        if separated_address.isascii() and "#" not in separated_address and "." not in separated_address and "/" not in separated_address:
+            output_tokens: list[_AddressToken] = []
+            current_position: int = 0
+            for word in separated_address.split():
+                current_position = separated_address.find(word, current_position)
+                if word[0] in "0123456789":
+                    token_type: _TokenType = _AddressToken.TYPE_NUMBER if word.isdigit() else _AddressToken.TYPE_NUMBERSUFFIXED
+                elif word[0] == "-":
+                    token_type = _AddressToken.TYPE_SPECIAL
                 else:
-                    # Append whatever character we have on hand to the previous token.
-                    if current_token.type_ == _AddressToken.TYPE_NUMBER:
-                        if re.match(r"\.", delivery_address[current_position]):
-                            # A dot indicates a decimal
-                            current_token.type_ = _AddressToken.TYPE_DECIMAL
-                        elif re.match(r"\/", delivery_address[current_position]):
-                            # A slash indicates a fraction
-                            current_token.type_ = _AddressToken.TYPE_FRACTION
-                        elif re.match(r"[^0-9]", delivery_address[current_position]):
-                            # This is no longer a number, but a suffixed number
-                            current_token.type_ = _AddressToken.TYPE_NUMBERSUFFIXED
-                    elif current_token.type_ == _AddressToken.TYPE_DECIMAL or current_token.type_ == _AddressToken.TYPE_FRACTION:
-                        if re.match(r"[^0-9]", delivery_address[current_position]):
-                            # This is not a decimal or a fraction, it is now a generic suffixed number.
-                            current_token.type_ = _AddressToken.TYPE_NUMBERSUFFIXED
-                    current_token.literal += delivery_address[current_position]
-            current_position += 1
-        # Append the last token in the string, if any.
-        if current_token is not None:
-            output_tokens.append(current_token)
-        return output_tokens
+                    token_type = _AddressToken.TYPE_WORD
+                output_tokens.append(_AddressToken(word, token_type, current_position))
+                current_position += len(word)
+            return output_tokens
+        
+        # Characters that are not matched by the regex are not parsed, and are skipped over by finditer().
+        token_types: Mapping[str, _TokenType] = _TokenType.__members__
+        return [_AddressToken(match.group(), token_types[match.lastgroup], match.start())
+                for match in _DELIVERY_ADDRESS_TOKEN_REGEX.finditer(delivery_address)]
+    
+    @staticmethod
+    def _match_highway_name(words: list[str]) -> tuple[int, Optional[str]]:
+        """
+        Internal function to find the longest highway name (as listed in HIGHWAY_MAPPING) at the start of a list of words.
+        
+        :param words: Token literals with periods removed, beginning with the potential highway name.
+        :return: The number of tokens making up the highway name and its standardized form, or (0, None) if there is no match.
+        """
+        matched_length: int = 0
+        matched_name: Optional[str] = None
+        current_node: dict = _HIGHWAY_NAME_TRIE
+        for i in range(len(words)):
+            current_node = current_node.get(words[i])
+            if current_node is None:
+                break
+            if None in current_node:
+                matched_length = i + 1
+                matched_name = current_node[None]
+        return matched_length, matched_name
     
     @staticmethod
+    @functools.lru_cache(maxsize=65536)
     def parse(delivery_address: str, last_line: str) -> Address:
         """
         Parses an address from a string. Requires delivery_address and last_line to be separated. Usually, these
@@ -251,6 +375,9 @@ class Address:
         With the exception of newlines, unknown characters are treated as spaces during parsing. There should
         not be any newlines in either parameter.
         
+        Since addresses are immutable, the results of recent calls are cached, and parsing the same address again will
+        return the same Address object. Call Address.parse.cache_clear() to empty the cache.
+        
         :param delivery_address: The delivery address (line immediately under the recipient name).
         :param last_line: The last line of the address, usually containing city, state, and ZIP.
         :return: A subclass of Address.
@@ -258,93 +385,201 @@ class Address:
         :raises ValueError: If there was an issue with parsing the address last line.
         """
         # Parse city, state, and zip first. Then, parse the delivery address itself.
+        city, state, zipcode, zipcode_ext = Address._parse_last_line(last_line)
+        unparsed_tokens: list[_AddressToken] = Address._lex_nonempty_delivery_address(delivery_address)
+        """List of tokens not yet parsed."""
+        
+        if len(unparsed_tokens) == 2 and unparsed_tokens[0].literal == "GENERAL" and unparsed_tokens[1].literal == "DELIVERY":
+            # General delivery
+            return GeneralDeliveryAddress(city, state, zipcode, zipcode_ext)
+        
+        # The first token with punctuation removed, so that forms like "P.O." and "R.R." are recognized as well.
+        first_token_letters: str = unparsed_tokens[0].literal.translate(_ALPHANUMERIC_FILTER)
+        box_address_type: Optional[AddressType] = _FIRST_TOKEN_ADDRESS_TYPES.get(first_token_letters)
+        box_index: int = 2
+        """Index of the "BOX" token for addresses identified by their first token(s)."""
+        if box_address_type is AddressType.POST_OFFICE_BOX:
+            box_index = 1
+        elif box_address_type is None and first_token_letters == "P" and len(unparsed_tokens) >= 2 and \
+                unparsed_tokens[1].literal.translate(_ALPHANUMERIC_FILTER) == "O":
+            # "P O BOX", with the letters of "PO" split across two tokens.
+            box_address_type = AddressType.POST_OFFICE_BOX
+        
+        if box_address_type is not None and len(unparsed_tokens) > box_index and unparsed_tokens[box_index].literal == "BOX":
+            if box_address_type is AddressType.POST_OFFICE_BOX:
+                return Address._parse_po_box_tokens(unparsed_tokens, box_index, delivery_address, city, state, zipcode, zipcode_ext)
+            return Address._parse_route_tokens(unparsed_tokens, box_address_type, first_token_letters, delivery_address, city, state,
+                    zipcode, zipcode_ext)
+        
+        # Assuming standard address
+        return Address._parse_standard_tokens(unparsed_tokens, delivery_address, city, state, zipcode, zipcode_ext)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=65536)
+    def parse_standard(delivery_address: str, last_line: str) -> StandardAddress:
+        """
+        Parses a standard street address from a string. This works like Address.parse(), but skips the checks for general
+        delivery, post office box, and route addresses, so it is faster when the addresses are known to be street addresses.
+        Like Address.parse(), the results of recent calls are cached. Call Address.parse_standard.cache_clear() to empty the cache.
+        
+        :param delivery_address: Refer to the documentation for Address.parse()
+        :param last_line: Refer to the documentation for Address.parse()
+        :return: The parsed standard address.
+        :raises AddressParseError: If there was an issue with parsing the delivery address.
+        :raises ValueError: If there was an issue with parsing the address last line.
+        """
+        city, state, zipcode, zipcode_ext = Address._parse_last_line(last_line)
+        unparsed_tokens: list[_AddressToken] = Address._lex_nonempty_delivery_address(delivery_address)
+        return Address._parse_standard_tokens(unparsed_tokens, delivery_address, city, state, zipcode, zipcode_ext)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=65536)
+    def parse_po_box(delivery_address: str, last_line: str) -> PostOfficeBoxAddress:
+        """
+        Parses a post office box address (such as PO BOX 123) from a string. This works like Address.parse(), but skips
+        the checks for every other type of address, so it is faster when the addresses are known to be post office boxes.
+        Like Address.parse(), the results of recent calls are cached. Call Address.parse_po_box.cache_clear() to empty the cache.
+        
+        :param delivery_address: Refer to the documentation for Address.parse()
+        :param last_line: Refer to the documentation for Address.parse()
+        :return: The parsed post office box address.
+        :raises AddressParseError: If the delivery address is not a post office box address, or could not otherwise be parsed.
+        :raises ValueError: If there was an issue with parsing the address last line.
+        """
+        city, state, zipcode, zipcode_ext = Address._parse_last_line(last_line)
+        unparsed_tokens: list[_AddressToken] = Address._lex_nonempty_delivery_address(delivery_address)
+        first_token_letters: str = unparsed_tokens[0].literal.translate(_ALPHANUMERIC_FILTER)
+        if first_token_letters == "PO" and len(unparsed_tokens) >= 2 and unparsed_tokens[1].literal == "BOX":
+            box_index: int = 1
+        elif first_token_letters == "P" and len(unparsed_tokens) >= 3 and \
+                unparsed_tokens[1].literal.translate(_ALPHANUMERIC_FILTER) == "O" and unparsed_tokens[2].literal == "BOX":
+            box_index = 2
+        else:
+            raise AddressParseError("expected post office box address", delivery_address, unparsed_tokens[0].index)
+        return Address._parse_po_box_tokens(unparsed_tokens, box_index, delivery_address, city, state, zipcode, zipcode_ext)
+    
+    @staticmethod
+    def _parse_last_line(last_line: str) -> tuple[str, str, str, Optional[str]]:
+        """
+        Internal function to parse the last line of an address.
+        
+        :param last_line: Refer to the documentation for Address.parse()
+        :return: The city, state, ZIP code, and extended ZIP code (or None) of the address.
+        :raises ValueError: If there was an issue with parsing the address last line.
+        """
         # All non-alphanumeric characters will be silently ignored.
-        last_line = last_line.upper().strip()
-        last_line = re.sub(r"\s", " ", last_line)
-        last_line = re.sub(r"[^A-Za-z0-9\s\-]", "", last_line)
+        last_line = last_line.upper().translate(_LAST_LINE_FILTER).strip()
         
-        last_line_tokens: list[str] = last_line.split(' ')
+        last_line_tokens: list[str] = last_line.split()
         city: str = ""
         state: str = ""
         zipcode: str = ""
         zipcode_ext: Optional[str] = ""
         if len(last_line_tokens) <= 1:
-            raise ValueError("Missing 2-character state code in address last line \"" + last_line + "\"")
+            raise ValueError(f"Missing 2-character state code in address last line \"{last_line}\"")
         if len(last_line_tokens) <= 2:
-            raise ValueError("Missing city in address last line \"" + last_line + "\"")
+            raise ValueError(f"Missing city in address last line \"{last_line}\"")
         
         # Now parse the tokens
-        if '-' in last_line_tokens[-1]:
+        if len(last_line_tokens[-1]) == 5 and last_line_tokens[-1].isdigit():
+            # Well-formed 5-digit ZIP, the most common case, validated with a single check.
+            zipcode = last_line_tokens[-1]
+            zipcode_ext = None
+        elif '-' in last_line_tokens[-1]:
             # ZIP+4
-            zipcode = last_line_tokens[-1].split('-')[0]
-            zipcode_ext = last_line_tokens[-1].split('-')[-1]
-            if re.search(r"[^0-9]", zipcode) or re.search(r"[^0-9]", zipcode_ext):
-                raise ValueError("Invalid characters in ZIP+4 code \"" + last_line_tokens[-1] + "\"")
+            zipcode, _, zipcode_ext = last_line_tokens[-1].partition('-')
+            if not (zipcode.isdigit() and zipcode_ext.isdigit()):
+                raise ValueError(f"Invalid characters in ZIP+4 code \"{last_line_tokens[-1]}\"")
             if len(zipcode) != 5 or len(zipcode_ext) != 4:
-                raise ValueError("ZIP+4 code \"" + last_line_tokens[-1] + "\" has the wrong length. All ZIP codes must be zero-padded.")
+                raise ValueError(f"ZIP+4 code \"{last_line_tokens[-1]}\" has the wrong length. All ZIP codes must be zero-padded.")
         else:
-            # ZIP
+            # Malformed ZIP, find out what is wrong with it
             zipcode = last_line_tokens[-1]
             zipcode_ext = None
-            if re.search(r"[^0-9]", zipcode):
-                raise ValueError("Invalid characters in ZIP code \"" + last_line_tokens[-1] + "\"")
+            if not zipcode.isdigit():
+                raise ValueError(f"Invalid characters in ZIP code \"{last_line_tokens[-1]}\"")
             if len(zipcode) != 5:
-                raise ValueError("ZIP code \"" + last_line_tokens[-1] + "\" has the wrong length. All ZIP codes must be zero-padded.")
+                raise ValueError(f"ZIP code \"{last_line_tokens[-1]}\" has the wrong length. All ZIP codes must be zero-padded.")
         if len(last_line_tokens[-2]) != 2:
-            raise ValueError("Invalid 2-character state code \"" + last_line_tokens[-2] + "\". The 2-character abbreviation should " + 
+            raise ValueError(f"Invalid 2-character state code \"{last_line_tokens[-2]}\". The 2-character abbreviation should "
                     "be used instead of the full state name.")
         state = last_line_tokens[-2]
         city = " ".join(last_line_tokens[:-2])
+        return city, state, zipcode, zipcode_ext
+    
+    @staticmethod
+    def _lex_nonempty_delivery_address(delivery_address: str) -> list[_AddressToken]:
+        """
+        Internal function to process a delivery address into a series of tokens, of which there must be at least one.
         
-        # At this point, the variables city, state, zipcode, and zipcode_ext should be populated. We now turn to parsing the delivery address.
-        
-        unparsed_tokens: list[_AddressToken] = Address._lex_delivery_address(delivery_address.upper().strip())
-        """List of tokens not yet parsed."""
-        
-        
-        # Make sure we have at least 1 token to work with.
-        if len(unparsed_tokens) == 0:
+        :param delivery_address: Refer to the documentation for Address.parse()
+        :return: List of Address tokens
+        :raises AddressParseError: If the delivery address could not be tokenized, or has no tokens.
+        """
+        tokens: list[_AddressToken] = Address._lex_delivery_address(delivery_address.upper().strip())
+        if len(tokens) == 0:
             raise AddressParseError("no valid tokens found", delivery_address, 0)
+        return tokens
+    
+    @staticmethod
+    def _parse_po_box_tokens(unparsed_tokens: list[_AddressToken], box_index: int, delivery_address: str, city: str, state: str,
+            zipcode: str, zipcode_ext: Optional[str]) -> PostOfficeBoxAddress:
+        """
+        Internal function to build a post office box address from its tokens.
         
-        if len(unparsed_tokens) == 2 and unparsed_tokens[0].literal == "GENERAL" and unparsed_tokens[1].literal == "DELIVERY":
-            # General delivery
-            return GeneralDeliveryAddress(city, state, zipcode, zipcode_ext)
-        elif re.sub(r"[^A-Za-z0-9]", "", unparsed_tokens[0].literal) in {"HC", "RR", "CPR", "OPC", "PSC", "UPR", "UNIT"} and (len(unparsed_tokens) >= 3 and unparsed_tokens[2].literal == "BOX"):
-            # TODO Make sure "RR03 BOX 98D" is correctly recognized as a Rural Route address.
-            route_address_type = "Highway Contract Route" if unparsed_tokens[0].literal == "HC" else "Rural Route"
-            if unparsed_tokens[0].literal not in {"HC", "RR"}:
-                route_address_type = "Overseas Military"
-            if len(unparsed_tokens) < 4:
-                raise AddressParseError("missing box number in " + route_address_type.lower() + " address", delivery_address, unparsed_tokens[-1].index + len(unparsed_tokens[-1].literal))
-            if unparsed_tokens[1].type_ not in {_AddressToken.TYPE_NUMBER, _AddressToken.TYPE_NUMBERSUFFIXED}:
-                raise AddressParseError("invalid " + route_address_type.lower() + " number, cannot begin with a letter or symbol", delivery_address, unparsed_tokens[1].index)
-            route_number: str = unparsed_tokens[1].literal
-            box_number: str = unparsed_tokens[3].literal
-            if unparsed_tokens[0].literal == "HC":
-                return HighwayContractRouteAddress(route_number, box_number, city, state, zipcode, zipcode_ext)
-            elif unparsed_tokens[0].literal == "RR":
-                return RuralRouteAddress(route_number, box_number, city, state, zipcode, zipcode_ext)
-            else:
-                # In the case of overseas military, the "route_number" is the address number.
-                return OverseasMilitaryAddress(unparsed_tokens[0].literal, route_number, box_number, city, state, zipcode, zipcode_ext)
-        elif len(unparsed_tokens) >= 2 and re.sub(r"[^A-Za-z0-9]", "", unparsed_tokens[0].literal) == "PO" and unparsed_tokens[1].literal == "BOX":
-            if len(unparsed_tokens) < 3:
-                raise AddressParseError("missing box number in post office box address", delivery_address, unparsed_tokens[-1].index + len(unparsed_tokens[-1].literal))
-            po_box_number: str = unparsed_tokens[2].literal
-            if po_box_number[0] == '-':
-                po_box_number = "0" + po_box_number[1:]
-            return PostOfficeBoxAddress(po_box_number, city, state, zipcode, zipcode_ext)
-        elif len(unparsed_tokens) >= 3 and re.sub(r"[^A-Za-z0-9]", "", unparsed_tokens[0].literal) == "P" and \
-                re.sub(r"[^A-Za-z0-9]", "", unparsed_tokens[1].literal) == "O" and unparsed_tokens[2].literal == "BOX":
-            if len(unparsed_tokens) < 4:
-                raise AddressParseError("missing box number in post office box address", delivery_address, unparsed_tokens[-1].index + len(unparsed_tokens[-1].literal))
-            po_box_number = unparsed_tokens[3].literal
-            if po_box_number[0] == '-':
-                po_box_number = "0" + po_box_number[1:]
-            return PostOfficeBoxAddress(po_box_number, city, state, zipcode, zipcode_ext)
+        :param unparsed_tokens: Tokens of the delivery address.
+        :param box_index: Index of the "BOX" token in unparsed_tokens.
+        :param delivery_address: The original delivery address, for error messages.
+        :return: The parsed post office box address.
+        :raises AddressParseError: If the box number is missing.
+        """
+        if len(unparsed_tokens) <= box_index + 1:
+            raise AddressParseError("missing box number in post office box address", delivery_address, unparsed_tokens[-1].index + len(unparsed_tokens[-1].literal))
+        po_box_number: str = unparsed_tokens[box_index + 1].literal
+        if po_box_number[0] == '-':
+            po_box_number = "0" + po_box_number[1:]
+        return PostOfficeBoxAddress(po_box_number, city, state, zipcode, zipcode_ext)
+    
+    @staticmethod
+    def _parse_route_tokens(unparsed_tokens: list[_AddressToken], box_address_type: AddressType, first_token_letters: str,
+            delivery_address: str, city: str, state: str, zipcode: str, zipcode_ext: Optional[str]) -> Address:
+        """
+        Internal function to build a highway contract route, rural route, or overseas military address from its tokens.
         
-        # Assuming standard address
+        :param unparsed_tokens: Tokens of the delivery address, the third of which is "BOX".
+        :param box_address_type: The type of address, as identified by the first token.
+        :param first_token_letters: The first token with punctuation removed.
+        :param delivery_address: The original delivery address, for error messages.
+        :return: The parsed address.
+        :raises AddressParseError: If the route (or address) number or box number is missing or invalid.
+        """
+        # TODO Make sure "RR03 BOX 98D" is correctly recognized as a Rural Route address.
+        route_address_type: str = box_address_type.value
+        if len(unparsed_tokens) < 4:
+            raise AddressParseError(f"missing box number in {route_address_type.lower()} address", delivery_address, unparsed_tokens[-1].index + len(unparsed_tokens[-1].literal))
+        if unparsed_tokens[1].type_ not in {_AddressToken.TYPE_NUMBER, _AddressToken.TYPE_NUMBERSUFFIXED}:
+            raise AddressParseError(f"invalid {route_address_type.lower()} number, cannot begin with a letter or symbol", delivery_address, unparsed_tokens[1].index)
+        route_number: str = unparsed_tokens[1].literal
+        box_number: str = unparsed_tokens[3].literal
+        if box_address_type is AddressType.HIGHWAY_CONTRACT_ROUTE:
+            return HighwayContractRouteAddress(route_number, box_number, city, state, zipcode, zipcode_ext)
+        elif box_address_type is AddressType.RURAL_ROUTE:
+            return RuralRouteAddress(route_number, box_number, city, state, zipcode, zipcode_ext)
+        else:
+            # In the case of overseas military, the "route_number" is the address number.
+            return OverseasMilitaryAddress(first_token_letters, route_number, box_number, city, state, zipcode, zipcode_ext)
+    
+    @staticmethod
+    def _parse_standard_tokens(unparsed_tokens: list[_AddressToken], delivery_address: str, city: str, state: str, zipcode: str,
+            zipcode_ext: Optional[str]) -> StandardAddress:
+        """
+        Internal function to build a standard address from its tokens.
         
+        :param unparsed_tokens: Tokens of the delivery address. This list is modified as the tokens are parsed.
+        :param delivery_address: The original delivery address, for error messages.
+        :return: The parsed standard address.
+        :raises AddressParseError: If there was an issue with parsing the delivery address.
+        """
         address_number: Optional[str] = None
         predirectional: Optional[str] = None
         street_name: Optional[str] = None
@@ -354,9 +589,9 @@ class Address:
         address2: Optional[str] = None
         
         # First, get the address number, if it exists.
-        if len(unparsed_tokens) >= 2 and \
-                unparsed_tokens[0].type_ in {_AddressToken.TYPE_NUMBER, _AddressToken.TYPE_FRACTION, _AddressToken.TYPE_DECIMAL} or \
-                (_AddressToken.TYPE_NUMBERSUFFIXED and "-" in unparsed_tokens[0].literal):
+        # Suffixed numbers only count if they are hyphenated, like the "123-45" in "123-45 MAIN ST".
+        if len(unparsed_tokens) >= 2 and (unparsed_tokens[0].type_ in _NUMERIC_TOKEN_TYPES or
+                (unparsed_tokens[0].type_ == _AddressToken.TYPE_NUMBERSUFFIXED and "-" in unparsed_tokens[0].literal)):
             address_number = unparsed_tokens[0].literal
             if unparsed_tokens[0].type_ == _AddressToken.TYPE_NUMBER and unparsed_tokens[1].type_ == _AddressToken.TYPE_FRACTION:
                 address_number += " " + unparsed_tokens[1].literal
@@ -365,25 +600,30 @@ class Address:
         
         # At this point, the address number has been popped. No need to worry about it again.
         
+        normalized_literals: list[str] = [x.literal.replace('.', "") for x in unparsed_tokens]
+        """Literal of each unparsed token with periods removed. Kept in step with unparsed_tokens."""
+        
         # Find where the suffix and secondary address identifier are.
         suffix_index: Optional[int] = None
         address2_index: Optional[int] = None
         already_seen_hashtag: bool = False  # Whether a hashtag has already been found.
-        for i in range(len(unparsed_tokens)):
-            current_token = unparsed_tokens[i]
-            if current_token.literal.replace('.', "") in SECONDARY_UNIT_INDICATORS:
-                address2_index = i
-            if current_token.literal.replace('.', "") in STREET_SUFFIXES:
-                suffix_index = i
-            if current_token.type_ == _AddressToken.TYPE_POUND:
+        for i, ((_, token_type, token_index), normalized_literal) in enumerate(zip(unparsed_tokens, normalized_literals)):
+            if token_type == _AddressToken.TYPE_POUND:
                 if already_seen_hashtag:
-                    raise AddressParseError("only at most one pound sign (#) is permitted in an address", delivery_address, current_token.index)
+                    raise AddressParseError("only at most one pound sign (#) is permitted in an address", delivery_address, token_index)
                 if address2_index is not None and i == address2_index + 1:
-                    raise AddressParseError("cannot have pound sign (#) if unit specifier is already present", delivery_address, current_token.index)
+                    raise AddressParseError("cannot have pound sign (#) if unit specifier is already present", delivery_address, token_index)
                 address2_index = i
                 already_seen_hashtag = True
-            if current_token.type_ == _AddressToken.TYPE_SPECIAL:
-                raise AddressParseError("unexpected token", delivery_address, current_token.index)
+            elif token_type == _AddressToken.TYPE_SPECIAL:
+                raise AddressParseError("unexpected token", delivery_address, token_index)
+            elif normalized_literal in _WORD_KINDS:
+                # Most words are part of the street name, and are ruled out by the membership test alone.
+                word_kind: int = _WORD_KINDS[normalized_literal]
+                if word_kind & _WORD_KIND_UNIT:
+                    address2_index = i
+                if word_kind & _WORD_KIND_SUFFIX:
+                    suffix_index = i
         
         # The secondary address must be after the street suffix.
         if suffix_index is not None and address2_index is not None and address2_index <= suffix_index:
@@ -394,19 +634,20 @@ class Address:
             address2_type = unparsed_tokens[address2_index].literal
             if address2_index == len(unparsed_tokens) - 1:
                 raise AddressParseError("missing number for secondary address", delivery_address, unparsed_tokens[-1].index + len(unparsed_tokens[-1].literal))
-            address2 = " ".join((x.literal for x in unparsed_tokens[address2_index+1:]))
+            address2 = " ".join([x.literal for x in unparsed_tokens[address2_index+1:]])
             
-            # Keep removing unparsed tokens until we have reached the index of address2.
-            while len(unparsed_tokens) > address2_index:
-                unparsed_tokens.pop()
+            # Remove the secondary address from the unparsed tokens.
+            del unparsed_tokens[address2_index:]
+            del normalized_literals[address2_index:]
         
         # Now, we have the predirectional, street name, and street suffix, and postdirectional.
         
         # Check if we have a postdirectional.
-        if len(unparsed_tokens) > 0 and unparsed_tokens[-1].literal.replace('.', "") in DIRECTIONS_LIST:
+        if len(unparsed_tokens) > 0 and normalized_literals[-1] in DIRECTIONS_LIST:
             # Yes, there is a postdirectional! Indicate its presence and pop it from the list.
             postdirectional = unparsed_tokens[-1].literal
             unparsed_tokens.pop()
+            normalized_literals.pop()
         
         # At this point, only the predirectional, street name, and street suffix should be in the list, if they exist at all.
         
@@ -415,33 +656,36 @@ class Address:
             # Okay, the "suffix" that we expected turned out not the be the suffix. That's okay, let's mark it as not a suffix.
             suffix_index = None
         
-        # TODO Standardize highway names (like COUNTY ROAD 238A, INTERSTATE 75, etc.)
-        
         if suffix_index is None:
             # The starting and ending index of the street name. If there is a postdirectional, don't count that here.
-            if len(unparsed_tokens) > 1 and unparsed_tokens[0].literal.replace('.', "") in DIRECTIONS_LIST:
+            if len(unparsed_tokens) > 1 and normalized_literals[0] in DIRECTIONS_LIST:
                 predirectional = unparsed_tokens[0].literal
                 unparsed_tokens.pop(0)
-            street_name = " ".join((x.literal for x in unparsed_tokens))
+                normalized_literals.pop(0)
+            # Standardize highway names (like COUNTY RD 238A, INTERSTATE HWY 75, etc.), as long as a highway number follows.
+            highway_name_length, highway_name = Address._match_highway_name(normalized_literals)
+            if highway_name is not None and highway_name_length < len(unparsed_tokens) and \
+                    unparsed_tokens[highway_name_length].type_ in _HIGHWAY_NUMBER_TOKEN_TYPES:
+                street_name = f"{highway_name} {' '.join([x.literal for x in unparsed_tokens[highway_name_length:]])}"
+            else:
+                street_name = " ".join([x.literal for x in unparsed_tokens])
         else:
             street_start_index = 0
             if suffix_index > 1:
-                if unparsed_tokens[0].literal.replace('.', "") in DIRECTIONS_LIST:
+                if normalized_literals[0] in DIRECTIONS_LIST:
                     predirectional = unparsed_tokens[0].literal
                     street_start_index = 1
             street_suffix = unparsed_tokens[suffix_index].literal
-            street_name = " ".join((x.literal for x in unparsed_tokens[street_start_index:suffix_index]))
+            street_name = " ".join([x.literal for x in unparsed_tokens[street_start_index:suffix_index]])
         
         # More standardization of the address.
         if predirectional is not None:
-            predirectional = re.sub(r"[^A-Za-z]", "", predirectional)
+            predirectional = _DIRECTIONS_CANONICAL[predirectional.translate(_ALPHABETIC_FILTER)]
         if postdirectional is not None:
-            postdirectional = re.sub(r"[^A-Za-z]", "", postdirectional)
+            postdirectional = _DIRECTIONS_CANONICAL[postdirectional.translate(_ALPHABETIC_FILTER)]
         if street_suffix is not None:
-            street_suffix = re.sub(r"[^A-Za-z]", "", street_suffix)
-        predirectional = DIRECTIONS_MAPPING[predirectional] if predirectional in DIRECTIONS_MAPPING else predirectional
-        postdirectional = DIRECTIONS_MAPPING[postdirectional] if postdirectional in DIRECTIONS_MAPPING else postdirectional
-        street_suffix = STREET_SUFFIX_MAPPING[street_suffix] if street_suffix in STREET_SUFFIX_MAPPING else street_suffix
+            street_suffix = street_suffix.translate(_ALPHABETIC_FILTER)
+            street_suffix = _STREET_SUFFIX_MAPPING.get(street_suffix, street_suffix)
         
         # Hyphens will be replaced with spaces by USPS as well.
         street_name = street_name.replace('-', ' ')
@@ -449,6 +693,20 @@ class Address:
         return StandardAddress(address_number, predirectional, street_name, street_suffix, postdirectional, address2_type, address2,
                 city, state, zipcode, zipcode_ext)
     
+    @staticmethod
+    def parse_batch(addresses: Iterable[tuple[str, str]]) -> list[Address]:
+        """
+        Parses many addresses at once. This is equivalent to calling Address.parse() on each address, but avoids
+        some per-call overhead when importing addresses in bulk.
+        
+        :param addresses: Pairs of (delivery_address, last_line), as would be passed to Address.parse().
+        :return: A list containing the parsed address for each pair, in the same order.
+        :raises AddressParseError: If there was an issue with parsing any of the delivery addresses.
+        :raises ValueError: If there was an issue with parsing any of the address last lines.
+        """
+        parse = Address.parse
+        return [parse(delivery_address, last_line) for delivery_address, last_line in addresses]
+    
     @property
     def type_(self) -> str:
         """
@@ -456,20 +714,66 @@ class Address:
         """
         return AddressType.BASE.value
     
+    def _key_fields(self) -> tuple[Optional[str], ...]:
+        """
+        Gets the fields that a subclass adds to the equality key, on top of the fields of Address. Subclasses with fields of their own
+        override this, and add its result to _key at the end of their __init__(). Should not be accessed outside of the addressutil
+        module.
+        """
+        return ()
+    
     def __eq__(self, other) -> bool:
-        if self.type_ != other.type_:
+        if self is other:
+            return True
+        if not isinstance(other, Address):
+            return NotImplemented
+        # Addresses that have both been hashed already can be told apart without comparing their fields.
+        if self._hash is not None and other._hash is not None and self._hash != other._hash:
             return False
-        return self.city == other.city and self.state == other.state and self.zipcode_full == other.zipcode_full
+        return self._key == other._key
     
     def __hash__(self) -> int:
-        return hash(self.__repr__())
+        if self._hash is None:
+            self._hash = hash(self._key)
+        return self._hash
+    
+    def __getstate__(self) -> tuple[Optional[dict], dict]:
+        # Defined explicitly so that pickle protocols 0 and 1, which do not support __slots__ on their own, work too.
+        slot_values: dict = {}
+        for cls in type(self).__mro__:
+            slot_names = cls.__dict__.get("__slots__", ())
+            for name in ((slot_names,) if isinstance(slot_names, str) else slot_names):
+                if name.startswith("__") and not name.endswith("__"):
+                    name = f"_{cls.__name__.lstrip('_')}{name}"  # Private slot names are mangled, like the attributes.
+                # The cached hash is left out, see __setstate__().
+                if name != "_hash" and hasattr(self, name):
+                    slot_values[name] = getattr(self, name)
+        return getattr(self, "__dict__", None) or None, slot_values
+    
+    def __setstate__(self, state: Union[dict, tuple[Optional[dict], Optional[dict]]]) -> None:
+        if isinstance(state, dict):
+            # Pickled by a release from before Address used __slots__. The state is the old instance __dict__, which only holds the
+            # fields given to __init__(), so the derived fields are rebuilt here.
+            instance_dict: Optional[dict] = None
+            slot_values: Optional[dict] = state
+        else:
+            instance_dict, slot_values = state
+        if instance_dict:
+            self.__dict__.update(instance_dict)
+        for name, value in (slot_values or {}).items():
+            setattr(self, name, value)
+        if isinstance(state, dict):
+            self.__zipcode_full = self.__zipcode if self.__zipcode_ext is None else f"{self.__zipcode}-{self.__zipcode_ext}"
+            self._key = (self.type_, self.__city, self.__state, self.__zipcode, self.__zipcode_ext) + self._key_fields()
+        # String hashes differ between interpreter runs, so a hash cached before pickling must not be restored.
+        self._hash = None
     
     def __repr__(self) -> str:
-        return "addressutil.Address(city=" + repr(self.__city) + ", state=" + repr(self.__state) + ", zipcode=" + repr(self.zipcode) + \
-                ", zipcode_ext=" + ("<uninitialized>" if self.__zipcode_ext is None else repr(self.__zipcode_ext)) + ")"
+        zipcode_ext: str = "<uninitialized>" if self.__zipcode_ext is None else repr(self.__zipcode_ext)
+        return f"addressutil.Address(city={self.__city!r}, state={self.__state!r}, zipcode={self.__zipcode!r}, zipcode_ext={zipcode_ext})"
     
     def __str__(self) -> str:
-        return "\n" + self.city + " " + self.state + " " + self.zipcode_full
+        return f"\n{self.__city} {self.__state} {self.__zipcode_full}"
 
 
 class AddressType(enum.Enum):
@@ -492,11 +796,27 @@ class AddressType(enum.Enum):
     """Objecst of type StandardAddress"""
 
 
+_FIRST_TOKEN_ADDRESS_TYPES: dict[str, AddressType] = {
+        "HC": AddressType.HIGHWAY_CONTRACT_ROUTE, "RR": AddressType.RURAL_ROUTE, "PO": AddressType.POST_OFFICE_BOX,
+        "CPR": AddressType.OVERSEAS_MILITARY, "OPC": AddressType.OVERSEAS_MILITARY, "PSC": AddressType.OVERSEAS_MILITARY,
+        "UPR": AddressType.OVERSEAS_MILITARY, "UNIT": AddressType.OVERSEAS_MILITARY}
+"""
+Mapping of the first token of a delivery address (with punctuation removed) to the type of address it begins, for address types
+identified by their first token. Used internally by Address.parse()
+"""
+
+_OVERSEAS_MILITARY_ADDRESS_TYPES: frozenset[str] = frozenset(
+        x for x, address_type in _FIRST_TOKEN_ADDRESS_TYPES.items() if address_type is AddressType.OVERSEAS_MILITARY)
+"""Set of valid address types for OverseasMilitaryAddress (CPR, OPC, PSC, UPR, and UNIT)"""
+
+
 class GeneralDeliveryAddress(Address):
     """
     Represents general delivery, the practice of delivering mail straight to the post office.
     """
     
+    __slots__ = ()
+    
     # Note: There is no __init__ function because general delivery doesn't require additional parameters.
     
     @property
@@ -504,16 +824,19 @@ class GeneralDeliveryAddress(Address):
         return AddressType.GENERAL_DELIVERY.value
     
     def __repr__(self) -> str:
-        return "addressutil.GeneralDeliveryAddress(" + super().__repr__() + ")"
+        return f"addressutil.GeneralDeliveryAddress({super().__repr__()})"
     
     def __str__(self) -> str:
-        return "GENERAL DELIVERY" + super().__str__()
+        return f"GENERAL DELIVERY{super().__str__()}"
 
 
 class HighwayContractRouteAddress(Address):
     """
     Represents a highway contract route.
     """
+    
+    __slots__ = ("__route_number", "__box_number")
+    
     def __init__(self, route_number: str, box_number: str, city: str, state: str, zipcode: str, zipcode_ext: Optional[str]):
         """
         :param route_number: The route number of the highway contract route
@@ -526,6 +849,10 @@ class HighwayContractRouteAddress(Address):
         super().__init__(city, state, zipcode, zipcode_ext)
         self.__route_number: str = str(route_number).upper()
         self.__box_number: str = str(box_number).upper()
+        self._key += self._key_fields()
+    
+    def _key_fields(self) -> tuple[Optional[str], ...]:
+        return (self.__route_number, self.__box_number)
     
     @property
     def route_number(self) -> str:
@@ -539,20 +866,20 @@ class HighwayContractRouteAddress(Address):
     def type_(self) -> str:
         return AddressType.HIGHWAY_CONTRACT_ROUTE.value
     
-    def __eq__(self, other) -> bool:
-        return super().__eq__(other) and self.route_number == other.route_number and self.box_number == other.box_number
-    
     def __repr__(self) -> str:
-        return "addressutil.HighwayContractRouteAddress(route_number=" + repr(self.__route_number) + ", box_number=" + repr(self.__box_number) + ", " + super().__repr__() + ")"
+        return f"addressutil.HighwayContractRouteAddress(route_number={self.__route_number!r}, box_number={self.__box_number!r}, {super().__repr__()})"
     
     def __str__(self) -> str:
-        return "HC " + self.__route_number + " BOX " + self.__box_number + super().__str__()
+        return f"HC {self.__route_number} BOX {self.__box_number}{super().__str__()}"
 
 
 class OverseasMilitaryAddress(Address):
     """
     Represents an overseas military address. For such addresses, the 2-character "state" abbreviation is usually AA, AE, or AP.
     """
+    
+    __slots__ = ("__address_type", "__address_number", "__box_number")
+    
     def __init__(self, address_type: str, address_number: str, box_number: str, city: str, state: str, zipcode: str, zipcode_ext: Optional[str]):
         """
         :param address_type: One of "CPR", "OPC", "PSC", "UPR", or "UNIT"
@@ -565,12 +892,17 @@ class OverseasMilitaryAddress(Address):
         :raises ValueError: If an invalid value is provided for address_type
         """
         super().__init__(city, state, zipcode, zipcode_ext)
-        valid_address_types: tuple[str, ...] = ("CPR", "OPC", "PSC", "UPR", "UNIT")
-        if address_type.upper() not in address_type:
-            raise ValueError("Invalid value \"" + address_type.upper() + "\" for address_type, address_type must be one of: " + ", ".join(valid_address_types))
+        address_type = address_type.upper()
+        if address_type not in _OVERSEAS_MILITARY_ADDRESS_TYPES:
+            raise ValueError(f"Invalid value \"{address_type}\" for address_type, address_type must be one of: "
+                    f"{', '.join(sorted(_OVERSEAS_MILITARY_ADDRESS_TYPES))}")
         self.__address_type: str = address_type
         self.__address_number: str = address_number
         self.__box_number: str = box_number
+        self._key += self._key_fields()
+    
+    def _key_fields(self) -> tuple[Optional[str], ...]:
+        return (self.__address_type, self.__address_number, self.__box_number)
     
     @property
     def address_number(self) -> str:
@@ -588,15 +920,12 @@ class OverseasMilitaryAddress(Address):
     def type_(self) -> str:
         return AddressType.OVERSEAS_MILITARY.value
     
-    def __eq__(self, other) -> bool:
-        return super().__eq__(other) and self.address_type == other.address_type and self.address_number == other.address_number and self.box_number == other.box_number
-    
     def __repr__(self) -> str:
-        return "addressutil.OverseasMilitaryAddress(address_type=" + repr(self.__address_type) + ", address_number=" + repr(self.__address_number) + ", box_number=" + repr(self.__box_number) + \
-                ", " + super().__repr__() + ")"
+        return f"addressutil.OverseasMilitaryAddress(address_type={self.__address_type!r}, address_number={self.__address_number!r}, " \
+                f"box_number={self.__box_number!r}, {super().__repr__()})"
     
     def __str__(self) -> str:
-        return self.__address_type + " " + self.__address_number + " BOX " + self.__box_number + super().__str__()
+        return f"{self.__address_type} {self.__address_number} BOX {self.__box_number}{super().__str__()}"
 
 
 class PostOfficeBoxAddress(Address):
@@ -605,6 +934,9 @@ class PostOfficeBoxAddress(Address):
     
     PO BOX 987 SPRINGFIELD IL 12345-6789
     """
+    
+    __slots__ = ("__box_number",)
+    
     def __init__(self, box_number: str, city: str, state: str, zipcode: str, zipcode_ext: Optional[str]):
         """
         Sample PO Box address: PO BOX 987 SPRINGFIELD IL 12345-6789
@@ -617,6 +949,10 @@ class PostOfficeBoxAddress(Address):
         """
         super().__init__(city, state, zipcode, zipcode_ext)
         self.__box_number: str = str(box_number).upper()
+        self._key += self._key_fields()
+    
+    def _key_fields(self) -> tuple[Optional[str], ...]:
+        return (self.__box_number,)
     
     @property
     def box_number(self) -> str:
@@ -629,20 +965,20 @@ class PostOfficeBoxAddress(Address):
     def type_(self) -> str:
         return AddressType.POST_OFFICE_BOX.value
     
-    def __eq__(self, other) -> bool:
-        return super().__eq__(other) and self.box_number == other.box_number
-    
     def __repr__(self) -> str:
-        return "addressutil.PostOfficeBoxAddress(box_number=" + repr(self.__box_number) + ", " + super().__repr__() + ")"
+        return f"addressutil.PostOfficeBoxAddress(box_number={self.__box_number!r}, {super().__repr__()})"
     
     def __str__(self) -> str:
-        return "PO BOX " + self.__box_number + super().__str__()
+        return f"PO BOX {self.__box_number}{super().__str__()}"
 
 
 class RuralRouteAddress(Address):
     """
     Represents a rural route address.
     """
+    
+    __slots__ = ("__route_number", "__box_number")
+    
     def __init__(self, route_number: str, box_number: str, city: str, state: str, zipcode: str, zipcode_ext: Optional[str]):
         """
         :param route_number: The route number of the rural route
@@ -655,6 +991,10 @@ class RuralRouteAddress(Address):
         super().__init__(city, state, zipcode, zipcode_ext)
         self.__route_number: str = str(route_number).upper()
         self.__box_number: str = str(box_number).upper()
+        self._key += self._key_fields()
+    
+    def _key_fields(self) -> tuple[Optional[str], ...]:
+        return (self.__route_number, self.__box_number)
     
     @property
     def route_number(self) -> str:
@@ -668,20 +1008,20 @@ class RuralRouteAddress(Address):
     def type_(self) -> str:
         return AddressType.RURAL_ROUTE.value
     
-    def __eq__(self, other) -> bool:
-        return super().__eq__(other) and self.route_number == other.route_number and self.box_number == other.box_number
-    
     def __repr__(self) -> str:
-        return "addressutil.RuralRouteAddress(route_number=" + repr(self.__route_number) + ", box_number=" + repr(self.__box_number) + ", " + super().__repr__() + ")"
+        return f"addressutil.RuralRouteAddress(route_number={self.__route_number!r}, box_number={self.__box_number!r}, {super().__repr__()})"
     
     def __str__(self) -> str:
-        return "RR " + self.__route_number + " BOX " + self.__box_number + super().__str__()
+        return f"RR {self.__route_number} BOX {self.__box_number}{super().__str__()}"
 
 
 class StandardAddress(Address):
     """
     Represents a standard address, the most common type of address in the United States.
     """
+    
+    __slots__ = ("__address_number", "__predirectional", "__street_name", "__suffix", "__postdirectional", "__address2_type", "__address2")
+    
     def __init__(self, address_number: Optional[str], predirectional: Optional[str], street_name: Optional[str], suffix: Optional[str], postdirectional: Optional[str], 
             address2_type: Optional[str], address2: Optional[str], city: str, state: str, zipcode: str, zipcode_ext: Optional[str]):
         """
@@ -711,6 +1051,11 @@ class StandardAddress(Address):
         self.__postdirectional: Optional[str] = postdirectional
         self.__address2_type: Optional[str] = address2_type
         self.__address2: Optional[str] = address2
+        self._key += self._key_fields()
+    
+    def _key_fields(self) -> tuple[Optional[str], ...]:
+        return (self.__address_number, self.__predirectional, self.__street_name, self.__suffix, self.__postdirectional,
+                self.__address2_type, self.__address2)
     
     @property
     def address2_type(self) -> Optional[str]:
@@ -770,39 +1115,81 @@ class StandardAddress(Address):
         Get the fields of this address as a tuple.
         :return: Tuple containing every field in the address, in the order utilized by USPS.
         """
-        standard_address_fields = []
-        standard_address_fields.append(self.__address_number)
-        standard_address_fields.append(self.__predirectional)
-        standard_address_fields.append(self.__street_name)
-        standard_address_fields.append(self.__suffix)
-        standard_address_fields.append(self.__postdirectional)
-        standard_address_fields.append(self.__address2_type)
-        standard_address_fields.append(self.__address2)
-        return tuple(standard_address_fields)
-    
-    def __eq__(self, other) -> bool:
-        return super().__eq__(other) and self.as_tuple() == other.as_tuple()
+        # The fields make up the end of the equality key, after the 5 fields of Address, so they are sliced from there instead of
+        # being kept in a slot of their own (which pickles from older releases would not have).
+        return self._key[5:]
     
     def __repr__(self) -> str:
-        return "addressutil.StandardAddress(" + ", ".join((("<unspecified>" if x is None else repr(x)) for x in self.as_tuple())) + ", " + super().__repr__() + ")"
+        fields: str = ", ".join(["<unspecified>" if x is None else repr(x) for x in self.as_tuple()])
+        return f"addressutil.StandardAddress({fields}, {super().__repr__()})"
     
     def __str__(self) -> str:
-        return " ".join((x for x in self.as_tuple() if x is not None)) + super().__str__()
+        return f"{' '.join([x for x in self.as_tuple() if x is not None])}{super().__str__()}"
 
 
 if __name__ == "__main__":
+    import pickle
+    
     print("Starting unit tests for addressutil.py...")
     test_addresses: tuple[str, ...] = ("123 N. MAIN ST.\nCHICAGO IL 12345", "4725 NORTHWEST 193RD COURT\nCHICAGO, IL, 29525-9186", 
     "1552 COUNTY ROAD 252\nCHICAGO IL 12345-6789", "1480 Inner Road\nGainesville, FL 32611", "General Delivery\nGainesville, FL, 32601", 
     "1234 S.E. BROADWAY AVE UNIT 5\nNEW YORK, NY, 10002", "PO BOX 15\nSPRINGFIELD IL 12345", "P.O. BOX C\nSPRINGFIELD IL 12345",
     "123 MAIN ST # 45\nSPRINGFIELD IL 12345", "123 MAIN ST #45\nSPRINGFIELD IL 12345", "51 1/2 362ND COURT SE\nCHICAGO, IL, 56124-7162",
-    "201 FILBERT ST,STE 700\nSAN FRANCISCO CA 94133-3242", "P. O. BOX 123\nSPRINGFIELD IL 12345", "P. O. BOX 123B\nSPRINGFIELD IL 12345",)
+    "201 FILBERT ST,STE 700\nSAN FRANCISCO CA 94133-3242", "P. O. BOX 123\nSPRINGFIELD IL 12345", "P. O. BOX 123B\nSPRINGFIELD IL 12345",
+    "8 CNTY RD 238A\nSPRINGFIELD IL 12345", "120 N US HWY 41 SUITE 3\nSPRINGFIELD IL 12345",
+    "R.R. 2 BOX 152\nSPRINGFIELD IL 12345",)
     for address in test_addresses:
         print(address)
         address_object: Address = Address.parse(*address.split('\n'))
         print(repr(address_object))
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            assert pickle.loads(pickle.dumps(address_object, protocol)) == address_object, f"Pickling with protocol {protocol} failed"
         assert address_object == Address.parse(*str(address_object).split("\n")), "Parsing the output string for address \"" + str(address_object).replace("\n", " ") + \
                 "\" is inconsistent, please check the code for Address.parse()"
+        if isinstance(address_object, StandardAddress):
+            assert address_object == Address.parse_standard(*address.split('\n')), "Address.parse_standard() disagrees with Address.parse()"
+        elif isinstance(address_object, PostOfficeBoxAddress):
+            assert address_object == Address.parse_po_box(*address.split('\n')), "Address.parse_po_box() disagrees with Address.parse()"
+    
+    # Regression tests for specific parsing behavior.
+    for delivery_address, street_name in (("1 US ROUTE 1", "US ROUTE 1"), ("10 SR EAGLE", "SR EAGLE"), ("5 RT ONE", "RT ONE")):
+        # Highway names are only standardized when a highway number follows them.
+        assert Address.parse(delivery_address, "SPRINGFIELD IL 12345").street_name == street_name, \
+                f"Street name \"{street_name}\" of \"{delivery_address}\" should not have been standardized"
+    for city, state in ((None, "IL"), (12345, "IL"), ("SPRINGFIELD", None), ("SPRINGFIELD", 12)):
+        # Only str subclasses are converted to strings, anything else is rejected.
+        try:
+            Address(city, state, "12345", None)
+        except (AttributeError, TypeError):
+            pass
+        else:
+            raise AssertionError(f"Address with city {city!r} and state {state!r} should have been rejected")
+    for delivery_address, street_name in (("100 CNTY HWY 12", "COUNTY HIGHWAY 12"), ("100 CR 7", "COUNTY ROAD 7"),
+            ("100 EXPY 5", "EXPRESSWAY 5"), ("100 HWY FM 1960", "FM 1960"), ("100 HIWAY 9", "HIGHWAY 9"), ("100 INTERSTATE HWY 75", "INTERSTATE 75"),
+            ("100 LOOP 410", "LOOP 410"), ("100 RD 6", "ROAD 6"), ("100 RTE 66", "ROUTE 66"), ("100 RANCH RD 620", "RANCH ROAD 620"),
+            ("100 ST HWY 71", "STATE HIGHWAY 71"), ("100 SR 60", "STATE ROAD 60"), ("100 ST RTE 9", "STATE ROUTE 9"),
+            ("100 TSR 4", "TOWNSHIP ROAD 4"), ("100 US 23A", "US HIGHWAY 23A")):
+        # One highway name for each standardized form in HIGHWAY_MAPPING.
+        assert Address.parse(delivery_address, "SPRINGFIELD IL 12345").street_name == street_name, \
+                f"Street name of \"{delivery_address}\" should have been standardized to \"{street_name}\""
+    assert Address.parse("WAL-MART PLZ", "SPRINGFIELD IL 12345").address_number is None, "\"WAL-MART\" is not an address number"
+    assert Address.parse("MAIN BOULEVARD", "SPRINGFIELD IL 12345").suffix == "BLVD", "Suffix \"BOULEVARD\" should have been standardized"
+    assert Address.parse("123 MAIN ST", "NEW  YORK NY 10002") == Address.parse("123 MAIN ST", "NEW YORK NY 10002"), \
+            "Repeated spaces in the city name should have been collapsed"
+    try:
+        OverseasMilitaryAddress("XX", "1", "2", "APO", "AE", "09001", None)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Overseas military address type \"XX\" should have been rejected")
+    try:
+        Address.parse("PO BOX", "SPRINGFIELD IL 12345")
+    except AddressParseError as error:
+        unpickled_error: AddressParseError = pickle.loads(pickle.dumps(error))
+        assert (str(unpickled_error), unpickled_error.description, unpickled_error.address_string, unpickled_error.index) == \
+                (str(error), error.description, error.address_string, error.index), "Pickling an AddressParseError failed"
+    else:
+        raise AssertionError("\"PO BOX\" without a box number should not have been parsed")
     print("The above are unit tests for this module. If you want to use this module instead, you should read the documentation.")
     print("You can get started by typing \"import addressutil\" at the beginning of your code.")
     
\ No newline at end of file